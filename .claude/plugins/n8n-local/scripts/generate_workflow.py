@@ -10,6 +10,10 @@ Usage:
 
     Or import as a module:
         from generate_workflow import WorkflowBuilder, NodeFactory
+
+    Bulk output as JSONL (one workflow per line):
+        from generate_workflow import save_many
+        save_many(builders, "workflows.jsonl")
 """
 
 from __future__ import annotations
@@ -17,7 +21,30 @@ from __future__ import annotations
 import json
 import uuid
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable, Sequence
+
+if TYPE_CHECKING:
+    from workflow_structs import WorkflowStruct
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Serialize to compact single-line JSON bytes (for JSONL output)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
 
 def generate_node_id() -> str:
@@ -25,15 +52,15 @@ def generate_node_id() -> str:
     return str(uuid.uuid4())
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Node:
-    """Represents an n8n workflow node."""
+    """Represents an n8n workflow node (parameters stay mutable)."""
 
     name: str
     node_type: str
     position: tuple[int, int]
     parameters: dict[str, Any] = field(default_factory=dict)
-    type_version: float = 1.0
+    type_version: int | float = 1.0
     credentials: dict[str, Any] | None = None
     id: str = field(default_factory=generate_node_id)
 
@@ -133,21 +160,28 @@ class NodeFactory:
         position: tuple[int, int] = (450, 300),
         url: str = "",
         method: str = "GET",
-        timeout: int = 10000
+        timeout: int = 10000,
+        json_body: str | None = None
     ) -> Node:
-        """Create an HTTP request node."""
+        """Create an HTTP request node, optionally sending a JSON body."""
+        parameters: dict[str, Any] = {
+            "url": url,
+            "method": method,
+            "options": {
+                "timeout": timeout
+            }
+        }
+        if json_body is not None:
+            parameters["sendBody"] = True
+            parameters["specifyBody"] = "json"
+            parameters["jsonBody"] = json_body
+
         return Node(
             name=name,
             node_type="n8n-nodes-base.httpRequest",
             position=position,
             type_version=4.1,
-            parameters={
-                "url": url,
-                "method": method,
-                "options": {
-                    "timeout": timeout
-                }
-            }
+            parameters=parameters
         )
 
     @staticmethod
@@ -155,19 +189,24 @@ class NodeFactory:
         name: str = "Code",
         position: tuple[int, int] = (450, 300),
         code: str = "return items;",
-        language: str = "javaScript"
+        language: str = "javaScript",
+        continue_on_fail: bool = False
     ) -> Node:
         """Create a code node."""
+        parameters: dict[str, Any] = {
+            "jsCode": code if language == "javaScript" else "",
+            "pythonCode": code if language == "python" else "",
+            "mode": "runOnceForAllItems"
+        }
+        if continue_on_fail:
+            parameters["continueOnFail"] = True
+
         return Node(
             name=name,
             node_type="n8n-nodes-base.code",
             position=position,
             type_version=2,
-            parameters={
-                "jsCode": code if language == "javaScript" else "",
-                "pythonCode": code if language == "python" else "",
-                "mode": "runOnceForAllItems"
-            }
+            parameters=parameters
         )
 
     @staticmethod
@@ -207,9 +246,15 @@ class NodeFactory:
     def set_node(
         name: str = "Set",
         position: tuple[int, int] = (450, 300),
-        assignments: list[dict[str, Any]] | None = None
+        assignments: Sequence[dict[str, Any]] | None = None
     ) -> Node:
-        """Create a set/edit fields node."""
+        """
+        Create a set/edit fields node.
+
+        Assignments can be any sequence of dicts. They are copied into a
+        fresh list of fresh dicts, so shared constants can be passed in and
+        the node's parameters stay safe to edit after creation.
+        """
         return Node(
             name=name,
             node_type="n8n-nodes-base.set",
@@ -218,7 +263,7 @@ class NodeFactory:
             parameters={
                 "mode": "manual",
                 "assignments": {
-                    "assignments": assignments or []
+                    "assignments": [dict(a) for a in assignments or ()]
                 }
             }
         )
@@ -228,18 +273,23 @@ class NodeFactory:
         name: str = "AI Agent",
         position: tuple[int, int] = (450, 300),
         prompt_type: str = "define",
-        text: str = "={{ $json.input }}"
+        text: str = "={{ $json.input }}",
+        system_message: str | None = None
     ) -> Node:
         """Create an AI agent node."""
+        parameters: dict[str, Any] = {
+            "promptType": prompt_type,
+            "text": text
+        }
+        if system_message:
+            parameters["systemMessage"] = system_message
+
         return Node(
             name=name,
             node_type="@n8n/n8n-nodes-langchain.agent",
             position=position,
             type_version=1.7,
-            parameters={
-                "promptType": prompt_type,
-                "text": text
-            }
+            parameters=parameters
         )
 
     @staticmethod
@@ -285,7 +335,7 @@ class NodeFactory:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Connection:
     """Represents a connection between two nodes."""
 
@@ -329,6 +379,19 @@ class WorkflowBuilder:
         ))
         return self
 
+    def connect_many(
+        self,
+        edges: Iterable[tuple[Any, ...]]
+    ) -> "WorkflowBuilder":
+        """
+        Connect several node pairs in one call.
+
+        Each edge is (source, target) with optional trailing source_output,
+        target_input and connection_type, in the same order as connect().
+        """
+        self.connections.extend(Connection(*edge) for edge in edges)
+        return self
+
     def connect_ai_model(
         self,
         model_node: str,
@@ -378,18 +441,15 @@ class WorkflowBuilder:
         connections_dict: dict[str, Any] = {}
 
         for conn in self.connections:
-            if conn.source not in connections_dict:
-                connections_dict[conn.source] = {}
-
             conn_type = conn.connection_type
-            if conn_type not in connections_dict[conn.source]:
-                connections_dict[conn.source][conn_type] = []
+            # One lookup per level instead of re-indexing from the top each time
+            outputs = connections_dict.setdefault(conn.source, {}).setdefault(conn_type, [])
 
             # Ensure we have enough output slots
-            while len(connections_dict[conn.source][conn_type]) <= conn.source_output:
-                connections_dict[conn.source][conn_type].append([])
+            while len(outputs) <= conn.source_output:
+                outputs.append([])
 
-            connections_dict[conn.source][conn_type][conn.source_output].append({
+            outputs[conn.source_output].append({
                 "node": conn.target,
                 "type": conn_type,
                 "index": conn.target_input
@@ -407,14 +467,38 @@ class WorkflowBuilder:
             "settings": self.settings
         }
 
+    def to_struct(self) -> WorkflowStruct:
+        """Export workflow as a typed msgspec WorkflowStruct (requires msgspec)."""
+        from workflow_structs import from_builder
+        return from_builder(self)
+
     def to_json(self, indent: int = 2) -> str:
         """Export workflow as JSON string."""
         return json.dumps(self.build(), indent=indent)
 
     def save(self, filepath: str) -> None:
         """Save workflow to file."""
-        with open(filepath, 'w') as f:
-            f.write(self.to_json())
+        with open(filepath, 'wb') as f:
+            f.write(_dumps(self.build()))
+
+
+def save_many(builders: Iterable[WorkflowBuilder], filepath: str) -> int:
+    """
+    Save many workflows to one JSONL file, one workflow per line.
+
+    For bulk generation this replaces one open/write/close per workflow
+    with a single buffered sequential write.
+
+    Returns:
+        Number of workflows written
+    """
+    count = 0
+    with open(filepath, 'wb') as f:
+        for builder in builders:
+            f.write(_dumps_line(builder.build()))
+            f.write(b"\n")
+            count += 1
+    return count
 
 
 def create_webhook_echo_workflow() -> WorkflowBuilder:
@@ -7,10 +7,12 @@ Provides higher-level workflow builders for common patterns:
 - Data pipelines with error handling
 - AI agent workflows with local LLM
 - Batch processing
+- Parallel bulk generation (batch_create_and_save)
 
 Usage:
     from workflow_patterns import (
         create_api_monitor_workflow,
+        create_api_monitor_workflow_json,
         create_ai_pipeline_workflow,
         create_data_pipeline_workflow,
         create_notification_workflow
@@ -22,14 +24,103 @@ Usage:
         interval_minutes=5
     )
     workflow.save("api_monitor.json")
+
+    # Build-then-save shortcut that skips the builder objects
+    with open("api_monitor.json", "wb") as f:
+        f.write(create_api_monitor_workflow_json(
+            name="API Health Monitor",
+            url="https://api.example.com/health"
+        ))
+
+Optional native build:
+    The builders are fully annotated and compile with mypyc. Python loads
+    the resulting extension modules in place of the .py files, so callers
+    need no changes:
+
+        cd .claude/plugins/n8n-local/scripts
+        mypyc workflow_patterns.py generate_workflow.py
 """
 
 from __future__ import annotations
 
 import json
-from typing import Any
-
-from generate_workflow import WorkflowBuilder, NodeFactory, Node
+import sys
+from itertools import repeat
+from pathlib import Path
+from string import Template
+from typing import Any, Callable
+
+from generate_workflow import WorkflowBuilder, NodeFactory, Node, generate_node_id
+
+
+# n8n expressions and node types shared across builds, interned once at import
+_ISO_NOW = sys.intern("={{ $now.toISO() }}")
+_JSON_BODY = sys.intern("={{ $json }}")
+_JSON_INPUT = sys.intern("={{ $json.input }}")
+_RESPONSE_TIME = sys.intern("={{ $response.responseTime }}")
+_NON_200_ERROR = sys.intern("={{ $json.error || 'Non-200 response: ' + $response.statusCode }}")
+_FIRST_INPUT = sys.intern("={{ $json.query || $json.input || $json.message || $json.prompt || 'Hello' }}")
+_SOURCE_OR_N8N = sys.intern("={{ $json.source || 'n8n' }}")
+_SPLIT_IN_BATCHES = sys.intern("n8n-nodes-base.splitInBatches")
+_HEALTHY = sys.intern("healthy")
+_UNHEALTHY = sys.intern("unhealthy")
+_TRUE = sys.intern("true")
+
+# JSON bodies for the notification channels, keyed by channel
+_SLACK_BODY = '{"text": "{{ $json.message }}"}'
+_DISCORD_BODY = '{"content": "{{ $json.message }}"}'
+_JSON_BODY_TEMPLATES: dict[str, str] = {
+    "slack": _SLACK_BODY,
+    "discord": _DISCORD_BODY,
+}
+
+# Constant Set node assignments, hoisted so each build only adds the
+# per-call fields (url, message). set_node copies them into each node.
+_LOG_SUCCESS_ASSIGNMENTS = (
+    {"name": "status", "value": _HEALTHY, "type": "string"},
+    {"name": "timestamp", "value": _ISO_NOW, "type": "string"},
+    {"name": "response_time_ms", "value": _RESPONSE_TIME, "type": "number"},
+)
+_LOG_FAILURE_ASSIGNMENTS = (
+    {"name": "status", "value": _UNHEALTHY, "type": "string"},
+    {"name": "timestamp", "value": _ISO_NOW, "type": "string"},
+    {"name": "error", "value": _NON_200_ERROR, "type": "string"},
+)
+_PREPARE_INPUT_ASSIGNMENTS = (
+    {"name": "input", "value": _FIRST_INPUT, "type": "string"},
+)
+_PIPELINE_LOG_ERROR_ASSIGNMENTS = (
+    {"name": "error_logged", "value": _TRUE, "type": "boolean"},
+    {"name": "timestamp", "value": _ISO_NOW, "type": "string"},
+)
+_PIPELINE_LOG_SUCCESS_ASSIGNMENTS = (
+    {"name": "success", "value": _TRUE, "type": "boolean"},
+    {"name": "timestamp", "value": _ISO_NOW, "type": "string"},
+)
+_FORMAT_MESSAGE_ASSIGNMENTS = (
+    {"name": "timestamp", "value": _ISO_NOW, "type": "string"},
+    {"name": "source", "value": _SOURCE_OR_N8N, "type": "string"},
+)
+
+# Node layouts, resolved once at import instead of tracked per build
+_DATA_PIPELINE_LAYOUT: dict[str, tuple[int, int]] = {
+    "Manual Trigger": (250, 300),
+    "Fetch Data": (450, 300),
+    "Transform Data": (650, 300),
+    "Process Batches": (850, 300),
+    "Process Item": (1050, 300),
+    "Has Error": (1250, 300),
+    "Log Error": (1450, 200),
+    "Log Success": (1450, 400),
+}
+# Send Results sits two columns past the last node of the main row
+_SEND_RESULTS_POSITION = {
+    True: (1650, 300),   # after the batch loop
+    False: (1250, 300),  # directly after Transform Data
+}
+# Rows for notification channels, assigned in order to the enabled ones
+_NOTIFY_CHANNEL_X = 650
+_NOTIFY_CHANNEL_ROWS = (300, 500)
 
 
 def create_api_monitor_workflow(
@@ -91,12 +182,10 @@ def create_api_monitor_workflow(
     success = NodeFactory.set_node(
         name="Log Success",
         position=(850, 200),
-        assignments=[
-            {"name": "status", "value": "healthy", "type": "string"},
-            {"name": "timestamp", "value": "={{ $now.toISO() }}", "type": "string"},
-            {"name": "url", "value": url, "type": "string"},
-            {"name": "response_time_ms", "value": "={{ $response.responseTime }}", "type": "number"}
-        ]
+        assignments=(
+            *_LOG_SUCCESS_ASSIGNMENTS,
+            {"name": "url", "value": url, "type": "string"}
+        )
     )
     builder.add_node(success)
 
@@ -104,20 +193,20 @@ def create_api_monitor_workflow(
     failure = NodeFactory.set_node(
         name="Log Failure",
         position=(850, 400),
-        assignments=[
-            {"name": "status", "value": "unhealthy", "type": "string"},
-            {"name": "timestamp", "value": "={{ $now.toISO() }}", "type": "string"},
-            {"name": "url", "value": url, "type": "string"},
-            {"name": "error", "value": "={{ $json.error || 'Non-200 response: ' + $response.statusCode }}", "type": "string"}
-        ]
+        assignments=(
+            *_LOG_FAILURE_ASSIGNMENTS,
+            {"name": "url", "value": url, "type": "string"}
+        )
     )
     builder.add_node(failure)
 
     # Connections
-    builder.connect("Schedule", "Check API")
-    builder.connect("Check API", "Is Healthy")
-    builder.connect("Is Healthy", "Log Success", source_output=0)
-    builder.connect("Is Healthy", "Log Failure", source_output=1)
+    edges = [
+        ("Schedule", "Check API"),
+        ("Check API", "Is Healthy"),
+        ("Is Healthy", "Log Success", 0),
+        ("Is Healthy", "Log Failure", 1),
+    ]
 
     # Optional success notification
     if success_webhook:
@@ -128,7 +217,7 @@ def create_api_monitor_workflow(
             position=(1050, 200)
         )
         builder.add_node(notify_success)
-        builder.connect("Log Success", "Notify Success")
+        edges.append(("Log Success", "Notify Success"))
 
     # Optional failure notification
     if failure_webhook:
@@ -139,11 +228,87 @@ def create_api_monitor_workflow(
             position=(1050, 400)
         )
         builder.add_node(notify_failure)
-        builder.connect("Log Failure", "Notify Failure")
+        edges.append(("Log Failure", "Notify Failure"))
 
+    builder.connect_many(edges)
     return builder
 
 
+# Rendered template and the number of $idN node-id placeholders in it
+_API_MONITOR_TEMPLATE: tuple[Template, int] | None = None
+
+
+def _api_monitor_template() -> tuple[Template, int]:
+    """
+    Render the API monitor workflow once with placeholders for its inputs.
+
+    The JSON text is produced by the regular builder so it can never drift
+    from create_api_monitor_workflow(); only the values are substituted later.
+
+    Returns:
+        The template and its node count, one $idN placeholder per node
+    """
+    global _API_MONITOR_TEMPLATE
+    if _API_MONITOR_TEMPLATE is None:
+        proto = create_api_monitor_workflow(
+            name="@@name@@",
+            url="@@url@@",
+            interval_minutes=-1357911,
+            timeout_ms=-2468022
+        )
+        # Escape n8n expressions ($json, $now, ...) before adding placeholders
+        text = proto.to_json().replace("$", "$$")
+        text = text.replace('"@@name@@"', "$name").replace('"@@url@@"', "$url")
+        text = text.replace("-1357911", "$interval").replace("-2468022", "$timeout")
+        for index, node in enumerate(proto.nodes):
+            text = text.replace(f'"{node.id}"', f"$id{index}")
+        _API_MONITOR_TEMPLATE = (Template(text), len(proto.nodes))
+    return _API_MONITOR_TEMPLATE
+
+
+def create_api_monitor_workflow_json(
+    name: str,
+    url: str,
+    interval_minutes: int = 5,
+    success_webhook: str | None = None,
+    failure_webhook: str | None = None,
+    timeout_ms: int = 10000
+) -> bytes:
+    """
+    Create an API health monitoring workflow as ready-to-save JSON.
+
+    Equivalent to create_api_monitor_workflow(...).to_json() for the
+    build-then-save path, but fills a pre-rendered template instead of
+    constructing Node and WorkflowBuilder objects.
+
+    Args:
+        name: Workflow name
+        url: URL to monitor
+        interval_minutes: Check interval in minutes (default: 5)
+        success_webhook: Optional webhook URL for success notifications
+        failure_webhook: Optional webhook URL for failure notifications
+        timeout_ms: Request timeout in milliseconds (default: 10000)
+
+    Returns:
+        UTF-8 encoded workflow JSON
+    """
+    if success_webhook or failure_webhook:
+        # Notification variants are rare; build them the regular way
+        return create_api_monitor_workflow(
+            name, url, interval_minutes, success_webhook, failure_webhook, timeout_ms
+        ).to_json().encode("utf-8")
+
+    template, node_count = _api_monitor_template()
+    node_ids = {f"id{i}": json.dumps(generate_node_id()) for i in range(node_count)}
+    return template.substitute(
+        node_ids,
+        name=json.dumps(name),
+        url=json.dumps(url),
+        interval=json.dumps(interval_minutes),
+        timeout=json.dumps(timeout_ms)
+    ).encode("utf-8")
+
+
 def create_ai_pipeline_workflow(
     name: str,
     trigger_type: str = "webhook",
@@ -181,7 +346,7 @@ def create_ai_pipeline_workflow(
         respond = NodeFactory.respond_to_webhook(
             name="Respond",
             position=(1050, 300),
-            response_body="={{ $json }}"
+            response_body=_JSON_BODY
         )
         builder.add_node(respond)
     elif trigger_type == "schedule":
@@ -202,13 +367,7 @@ def create_ai_pipeline_workflow(
     set_input = NodeFactory.set_node(
         name="Prepare Input",
         position=(450, 300),
-        assignments=[
-            {
-                "name": "input",
-                "value": "={{ $json.query || $json.input || $json.message || $json.prompt || 'Hello' }}",
-                "type": "string"
-            }
-        ]
+        assignments=_PREPARE_INPUT_ASSIGNMENTS
     )
     builder.add_node(set_input)
 
@@ -216,11 +375,9 @@ def create_ai_pipeline_workflow(
     agent = NodeFactory.ai_agent(
         name="AI Agent",
         position=(650, 300),
-        text="={{ $json.input }}"
+        text=_JSON_INPUT,
+        system_message=system_prompt
     )
-    # Add system message if provided
-    if system_prompt:
-        agent.parameters["systemMessage"] = system_prompt
     builder.add_node(agent)
 
     # Language model (local LLM via LM Studio)
@@ -235,13 +392,15 @@ def create_ai_pipeline_workflow(
     builder.add_node(model)
 
     # Connections
-    builder.connect(trigger.name, "Prepare Input")
-    builder.connect("Prepare Input", "AI Agent")
-    builder.connect_ai_model("LLM Model", "AI Agent")
-
+    edges = [
+        (trigger.name, "Prepare Input"),
+        ("Prepare Input", "AI Agent"),
+    ]
     if trigger_type == "webhook":
-        builder.connect("AI Agent", "Respond")
+        edges.append(("AI Agent", "Respond"))
 
+    builder.connect_many(edges)
+    builder.connect_ai_model("LLM Model", "AI Agent")
     return builder
 
 
@@ -270,11 +429,12 @@ def create_data_pipeline_workflow(
         WorkflowBuilder configured for data pipeline
     """
     builder = WorkflowBuilder(name)
+    layout = _DATA_PIPELINE_LAYOUT
 
     # Manual trigger
     trigger = NodeFactory.manual_trigger(
         name="Manual Trigger",
-        position=(250, 300)
+        position=layout["Manual Trigger"]
     )
     builder.add_node(trigger)
 
@@ -283,53 +443,47 @@ def create_data_pipeline_workflow(
         name="Fetch Data",
         url=source_url,
         method="GET",
-        position=(450, 300)
+        position=layout["Fetch Data"]
     )
     builder.add_node(fetch)
 
     # Transform data
     transform = NodeFactory.code_node(
         name="Transform Data",
-        position=(650, 300),
+        position=layout["Transform Data"],
         code=transform_code
     )
     builder.add_node(transform)
 
-    builder.connect("Manual Trigger", "Fetch Data")
-    builder.connect("Fetch Data", "Transform Data")
-
-    current_node = "Transform Data"
-    x_pos = 850
+    edges: list[tuple[Any, ...]] = [
+        ("Manual Trigger", "Fetch Data"),
+        ("Fetch Data", "Transform Data"),
+    ]
 
     if include_error_handling:
         # Batch processing node
         batch = Node(
             name="Process Batches",
-            node_type="n8n-nodes-base.splitInBatches",
-            position=(x_pos, 300),
+            node_type=_SPLIT_IN_BATCHES,
+            position=layout["Process Batches"],
             type_version=3,
             parameters={"batchSize": batch_size}
         )
         builder.add_node(batch)
-        builder.connect(current_node, "Process Batches")
-
-        x_pos += 200
 
         # Process each item with error tolerance
         process = NodeFactory.code_node(
             name="Process Item",
-            position=(x_pos, 300),
-            code="// Process each item\nreturn items;"
+            position=layout["Process Item"],
+            code="// Process each item\nreturn items;",
+            continue_on_fail=True
         )
-        process.parameters["continueOnFail"] = True
         builder.add_node(process)
 
-        x_pos += 200
-
         # Error check
         check = NodeFactory.if_node(
             name="Has Error",
-            position=(x_pos, 300),
+            position=layout["Has Error"],
             left_value="{{ $json.error }}",
             right_value="",
             operation="notEmpty"
@@ -339,51 +493,47 @@ def create_data_pipeline_workflow(
         # Log nodes
         log_error = NodeFactory.set_node(
             name="Log Error",
-            position=(x_pos + 200, 200),
-            assignments=[
-                {"name": "error_logged", "value": "true", "type": "boolean"},
-                {"name": "timestamp", "value": "={{ $now.toISO() }}", "type": "string"}
-            ]
+            position=layout["Log Error"],
+            assignments=_PIPELINE_LOG_ERROR_ASSIGNMENTS
         )
         builder.add_node(log_error)
 
         log_success = NodeFactory.set_node(
             name="Log Success",
-            position=(x_pos + 200, 400),
-            assignments=[
-                {"name": "success", "value": "true", "type": "boolean"},
-                {"name": "timestamp", "value": "={{ $now.toISO() }}", "type": "string"}
-            ]
+            position=layout["Log Success"],
+            assignments=_PIPELINE_LOG_SUCCESS_ASSIGNMENTS
         )
         builder.add_node(log_success)
 
         # Connect batch processing flow
-        builder.connect("Process Batches", "Process Item", source_output=0)
-        builder.connect("Process Item", "Has Error")
-        builder.connect("Has Error", "Log Error", source_output=0)
-        builder.connect("Has Error", "Log Success", source_output=1)
-        builder.connect("Log Error", "Process Batches")
-        builder.connect("Log Success", "Process Batches")
-
-        current_node = "Process Batches"
+        # Tuple of constants, folded into a single code-object constant
+        edges.extend((
+            ("Transform Data", "Process Batches"),
+            ("Process Batches", "Process Item", 0),
+            ("Process Item", "Has Error"),
+            ("Has Error", "Log Error", 0),
+            ("Has Error", "Log Success", 1),
+            ("Log Error", "Process Batches"),
+            ("Log Success", "Process Batches"),
+        ))
 
     # Optional destination
     if destination_url:
-        x_pos += 400
         send = NodeFactory.http_request(
             name="Send Results",
             url=destination_url,
             method="POST",
-            position=(x_pos, 300)
+            position=_SEND_RESULTS_POSITION[include_error_handling]
         )
         builder.add_node(send)
 
         if include_error_handling:
             # Connect from batch done output (index 1)
-            builder.connect("Process Batches", "Send Results", source_output=1)
+            edges.append(("Process Batches", "Send Results", 1))
         else:
-            builder.connect(current_node, "Send Results")
+            edges.append(("Transform Data", "Send Results"))
 
+    builder.connect_many(edges)
     return builder
 
 
@@ -429,47 +579,41 @@ def create_notification_workflow(
     format_msg = NodeFactory.set_node(
         name="Format Message",
         position=(450, 300),
-        assignments=[
+        assignments=(
             {"name": "message", "value": message_template, "type": "string"},
-            {"name": "timestamp", "value": "={{ $now.toISO() }}", "type": "string"},
-            {"name": "source", "value": "={{ $json.source || 'n8n' }}", "type": "string"}
-        ]
+            *_FORMAT_MESSAGE_ASSIGNMENTS
+        )
     )
     builder.add_node(format_msg)
-    builder.connect(trigger.name, "Format Message")
+    edges = [(trigger.name, "Format Message")]
 
-    x_pos = 650
-    y_offset = 0
+    rows = iter(_NOTIFY_CHANNEL_ROWS)
 
     if slack_webhook:
         slack = NodeFactory.http_request(
             name="Send to Slack",
             url=slack_webhook,
             method="POST",
-            position=(x_pos, 300 + y_offset)
+            position=(_NOTIFY_CHANNEL_X, next(rows)),
+            # Slack expects specific JSON format
+            json_body=_JSON_BODY_TEMPLATES["slack"]
         )
-        # Slack expects specific JSON format
-        slack.parameters["sendBody"] = True
-        slack.parameters["specifyBody"] = "json"
-        slack.parameters["jsonBody"] = '{"text": "{{ $json.message }}"}'
         builder.add_node(slack)
-        builder.connect("Format Message", "Send to Slack")
-        y_offset += 200
+        edges.append(("Format Message", "Send to Slack"))
 
     if discord_webhook:
         discord = NodeFactory.http_request(
             name="Send to Discord",
             url=discord_webhook,
             method="POST",
-            position=(x_pos, 300 + y_offset)
+            position=(_NOTIFY_CHANNEL_X, next(rows)),
+            # Discord webhook format
+            json_body=_JSON_BODY_TEMPLATES["discord"]
         )
-        # Discord webhook format
-        discord.parameters["sendBody"] = True
-        discord.parameters["specifyBody"] = "json"
-        discord.parameters["jsonBody"] = '{"content": "{{ $json.message }}"}'
         builder.add_node(discord)
-        builder.connect("Format Message", "Send to Discord")
+        edges.append(("Format Message", "Send to Discord"))
 
+    builder.connect_many(edges)
     return builder
 
 
@@ -499,7 +643,7 @@ def create_webhook_echo_workflow(
     respond = NodeFactory.respond_to_webhook(
         name="Respond",
         position=(450, 300),
-        response_body="={{ $json }}"
+        response_body=_JSON_BODY
     )
     builder.add_node(respond)
 
@@ -508,6 +652,66 @@ def create_webhook_echo_workflow(
     return builder
 
 
+_PATTERN_BUILDERS: dict[str, Callable[..., WorkflowBuilder]] = {
+    "api_monitor": create_api_monitor_workflow,
+    "ai_pipeline": create_ai_pipeline_workflow,
+    "data_pipeline": create_data_pipeline_workflow,
+    "notification": create_notification_workflow,
+    "webhook_echo": create_webhook_echo_workflow,
+}
+
+
+def _build_and_save(spec: dict[str, Any], out_dir: Path, index: int) -> str:
+    """Build one workflow from a spec and save it (runs in a worker process)."""
+    params = dict(spec)
+    pattern = params.pop("pattern")
+    filename = params.pop("filename", None) or f"{pattern}_{index}.json"
+
+    builder_fn = _PATTERN_BUILDERS.get(pattern)
+    if builder_fn is None:
+        raise ValueError(f"Unknown workflow pattern: {pattern}")
+
+    filepath = out_dir / filename
+    builder_fn(**params).save(str(filepath))
+    return str(filepath)
+
+
+def batch_create_and_save(
+    specs: list[dict[str, Any]],
+    out_dir: str | Path,
+    max_workers: int | None = None
+) -> list[str]:
+    """
+    Build and save many workflows in parallel across CPU cores.
+
+    Each spec names a pattern plus the keyword arguments for its builder,
+    e.g. {"pattern": "api_monitor", "name": "API 1", "url": "https://..."}.
+    An optional "filename" key overrides the default "<pattern>_<index>.json".
+
+    Args:
+        specs: Workflow specifications
+        out_dir: Directory to write the workflow files to
+        max_workers: Worker process count (default: CPU count)
+
+    Returns:
+        Paths of the saved workflow files, in spec order
+    """
+    # multiprocessing is a heavy import; only pay for it on the batch path
+    from concurrent.futures import ProcessPoolExecutor
+
+    out_path = Path(out_dir)
+    out_path.mkdir(parents=True, exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            _build_and_save,
+            specs,
+            repeat(out_path),
+            range(len(specs)),
+            chunksize=32
+        ))
+
+
 if __name__ == "__main__":
     import sys
 
@@ -548,6 +752,20 @@ if __name__ == "__main__":
     print(f"   Nodes: {len(data_pipeline.nodes)}")
     print(f"   Connections: {len(data_pipeline.connections)}")
 
+    # 4. JSON fast path, checked against the regular builder
+    print("\n4. API Monitor JSON fast path:")
+    fast = json.loads(create_api_monitor_workflow_json(
+        name="API Health Monitor",
+        url="https://api.example.com/health"
+    ))
+    built = json.loads(create_api_monitor_workflow(
+        name="API Health Monitor",
+        url="https://api.example.com/health"
+    ).to_json())
+    assert len(fast["nodes"]) == len(built["nodes"]), "fast path node count differs from to_json()"
+    assert len({node["id"] for node in fast["nodes"]}) == len(fast["nodes"]), "duplicate node ids"
+    print(f"   Nodes: {len(fast['nodes'])} (matches to_json())")
+
     # Save demo workflow
     if len(sys.argv) > 1 and sys.argv[1] == "--save":
         api_monitor.save("/tmp/demo_api_monitor.json")
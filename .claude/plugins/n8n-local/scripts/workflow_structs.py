@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Typed msgspec structs for n8n workflow JSON.
+
+Optional companion to generate_workflow.py: converts a built workflow into
+msgspec Structs, which validate on decode and encode to JSON faster than
+plain dicts. Requires `pip install msgspec`.
+
+Usage:
+    from workflow_patterns import create_api_monitor_workflow
+    from workflow_structs import encode, decode
+
+    struct = create_api_monitor_workflow("API Monitor", "https://...").to_struct()
+    data = encode(struct)          # bytes
+    workflow = decode(data)        # validated WorkflowStruct
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import msgspec
+
+if TYPE_CHECKING:
+    from generate_workflow import WorkflowBuilder
+
+
+class NodeStruct(msgspec.Struct, omit_defaults=True, rename={
+    "node_type": "type",
+    "type_version": "typeVersion",
+}):
+    """An n8n workflow node, field order matching Node.to_dict()."""
+
+    id: str
+    name: str
+    node_type: str
+    type_version: int | float
+    position: tuple[int, int]
+    parameters: dict[str, Any]
+    credentials: dict[str, Any] | None = None
+
+
+class WorkflowStruct(msgspec.Struct):
+    """A complete n8n workflow, field order matching WorkflowBuilder.build()."""
+
+    name: str
+    nodes: list[NodeStruct]
+    connections: dict[str, Any]
+    active: bool = False
+    settings: dict[str, Any] = msgspec.field(default_factory=lambda: {"executionOrder": "v1"})
+
+
+_ENCODER = msgspec.json.Encoder()
+_DECODER = msgspec.json.Decoder(WorkflowStruct)
+
+
+def from_builder(builder: WorkflowBuilder) -> WorkflowStruct:
+    """Convert a WorkflowBuilder into a WorkflowStruct."""
+    return WorkflowStruct(
+        name=builder.name,
+        nodes=[
+            NodeStruct(
+                id=node.id,
+                name=node.name,
+                node_type=node.node_type,
+                type_version=node.type_version,
+                position=node.position,
+                parameters=node.parameters,
+                credentials=node.credentials or None
+            )
+            for node in builder.nodes
+        ],
+        connections=builder._build_connections(),
+        active=builder.active,
+        settings=builder.settings
+    )
+
+
+def encode(workflow: WorkflowStruct) -> bytes:
+    """Encode a workflow struct as compact JSON bytes."""
+    return _ENCODER.encode(workflow)
+
+
+def decode(data: bytes | str) -> WorkflowStruct:
+    """Decode and validate workflow JSON into a WorkflowStruct."""
+    return _DECODER.decode(data)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Shared, memoized loader for the NotebookLM MCP auth file.
+
+service_status.py, setup.py and verify_auth.py all read
+~/.notebooklm-mcp/auth.json. Loading it through here parses the file once
+per process for as long as its modification time and size are unchanged.
+
+Usage:
+    from _auth_cache import load_auth
+
+    auth_data = load_auth()  # None if the file does not exist
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from _json_utils import loads
+
+# Configuration
+AUTH_FILE = Path.home() / ".notebooklm-mcp" / "auth.json"
+
+
+@lru_cache(maxsize=4)
+def _load(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse the file; the stat fields only key the cache."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    return loads(raw)
+
+
+def load_auth(path: Path = AUTH_FILE) -> Any:
+    """
+    Load the auth file, reusing the previous parse while it is unchanged.
+
+    The returned object is shared between callers and must not be modified.
+
+    Returns:
+        Parsed JSON, or None if the file does not exist
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return _load(str(path), stat.st_mtime_ns, stat.st_size)
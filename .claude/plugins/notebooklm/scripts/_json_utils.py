@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+JSON helpers shared by the NotebookLM scripts.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise, with the same output either way: UTF-8 bytes, compact by
+default or indented by two spaces.
+
+Usage:
+    from _json_utils import dumps, loads, write_json_atomic
+
+    data = loads(path.read_bytes())
+    path.write_bytes(dumps(data, pretty=True))
+    write_json_atomic(cache_path, data)  # never leaves a partial file
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(raw: bytes | str) -> Any:
+    """
+    Parse JSON, using orjson when it is installed.
+
+    Raises:
+        json.JSONDecodeError: If raw is not valid JSON (orjson's error is a
+            subclass)
+    """
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def write_json_atomic(path: Path, data: Any) -> None:
+    """
+    Write compact JSON through a temporary file renamed into place, so
+    concurrent readers never see a partial file.
+
+    Best effort, for caches: the parent directory is created if needed,
+    and on failure the temporary file is removed and nothing is raised.
+    """
+    tmp_name = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=path.parent, suffix=".tmp", delete=False
+        ) as f:
+            tmp_name = f.name
+            f.write(dumps(data))
+        os.replace(tmp_name, path)
+    except OSError:
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
@@ -14,29 +14,95 @@ Usage:
 
 Environment Variables:
     LM_STUDIO_URL - Local LLM endpoint (default: http://localhost:1234)
+    LM_STUDIO_EMBED_MODEL - Embedding model for the response cache and
+        `query --mode retrieve`
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import hashlib
 import json
 import os
+import sqlite3
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import lru_cache
+from http.client import HTTPException
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+from _json_utils import dumps, loads
+from cache import DEFAULT_CACHE_PATH, DEFAULT_TTL_DAYS, SemanticCache
+from notebook_utils import chunk_text, truncate_to_tokens
 
 # Configuration
 LM_STUDIO_URL = os.environ.get("LM_STUDIO_URL", "http://localhost:1234")
+# Embedding model for semantic cache lookups (unset: exact-match caching only)
+LM_STUDIO_EMBED_MODEL = os.environ.get("LM_STUDIO_EMBED_MODEL")
+# Texts per /v1/embeddings request
+EMBED_BATCH_SIZE = 32
 NOTEBOOKLM_MCP_URL = os.environ.get("NOTEBOOKLM_MCP_URL", "http://localhost:3000")
 DEFAULT_OUTPUT_DIR = Path("extracted_content")
+# Requests kept in flight against LM Studio; its server batches concurrent
+# requests together, so this raises GPU utilisation over one-at-a-time calls
+DEFAULT_CONCURRENCY = 8
 
+# System message used when a call doesn't supply its own
+DEFAULT_SYSTEM_PROMPT = "You are a helpful assistant that analyzes and summarizes content."
+# Tokens of content/context sent to the model per request
+MAX_CONTEXT_TOKENS = 3500
 
-@dataclass
+# Retrieval mode: per-chunk embedding index, stored per input directory
+# under INDEX_CACHE_DIR rather than in the (possibly read-only) input dir
+INDEX_CACHE_DIR = DEFAULT_CACHE_PATH.parent / "retrieval"
+INDEX_FILE = ".index.npy"
+INDEX_CHUNKS_FILE = ".chunks.jsonl"
+# What the saved index was built from; written last, so a valid manifest
+# always describes a complete index
+INDEX_MANIFEST_FILE = ".index.manifest"
+RETRIEVE_CHUNK_SIZE = 1000
+RETRIEVE_CHUNK_OVERLAP = 100
+RETRIEVE_TOP_K = 5
+
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+# Keep-alive session shared by all LM Studio calls (created on first use)
+_SESSION: requests.Session | None = None
+
+# Last LM Studio health probe as (monotonic time, healthy, status)
+_HEALTH_CACHE: tuple[float, bool, str] | None = None
+HEALTH_CACHE_TTL = 5.0
+
+# (content, prompt, max_tokens, system_prompt) for local_llm_batch
+LLMJob = tuple[str, str, int, "str | None"]
+
+
+@dataclass(slots=True)
 class ExtractionResult:
     """Result of extracting content from a source."""
     source_id: str
@@ -47,7 +113,7 @@ class ExtractionResult:
     extracted_at: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchResult:
     """Result of a batch operation."""
     operation: str
@@ -60,24 +126,184 @@ class BatchResult:
     tokens_saved_estimate: int = 0
 
 
+class _JsonlWriter:
+    """
+    Append result records to a JSONL file as they arrive.
+
+    Each write is flushed so partial progress survives a crash, and no
+    record is held in memory. Records land in completion order, tagged
+    with their job "index"; _finish_output restores index order.
+    """
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.count = 0
+        self._file = open(path, "wb")
+
+    def add(self, index: int, record: dict | None) -> None:
+        """Write the result for job `index` (None for a failed job)."""
+        if record is None:
+            return
+        self._file.write(dumps({"index": index, **record}) + b"\n")
+        self._file.flush()
+        self.count += 1
+
+    def __enter__(self) -> _JsonlWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._file.close()
+
+
+def _finish_output(
+    jsonl_path: Path,
+    output_file: Path,
+    keep_jsonl: bool,
+    count: int,
+    pretty: bool = False
+) -> Path | None:
+    """
+    Turn the incremental JSONL into the final output.
+
+    Returns the JSONL itself (completion order, each record tagged with
+    its "index") when `keep_jsonl` is set. Otherwise converts it to a JSON
+    array at `output_file` in index order, without the tags (indented if
+    `pretty`), and removes it. Returns None (and removes the file) when
+    nothing was written.
+    """
+    if not count:
+        jsonl_path.unlink(missing_ok=True)
+        return None
+
+    if keep_jsonl:
+        return jsonl_path
+
+    with open(jsonl_path, "rb") as f:
+        records = [loads(line) for line in f]
+    records.sort(key=lambda record: record["index"])
+    for record in records:
+        del record["index"]
+    output_file.write_bytes(dumps(records, pretty))
+    jsonl_path.unlink()
+    return output_file
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed."""
+    return loads(path.read_bytes())
+
+
+def _load_json_files(paths: list[Path]) -> list[tuple[Path, Any, str | None]]:
+    """
+    Read and parse JSON files.
+
+    Files are read on a thread pool, since the work is mostly disk I/O.
+    Returns (path, data, error) per file in order; `error` is set when the
+    file couldn't be read or parsed.
+    """
+    def load(path: Path) -> tuple[Path, Any, str | None]:
+        try:
+            return path, _read_json(path), None
+        except Exception as e:
+            return path, None, str(e)
+
+    if len(paths) < 2:
+        return [load(path) for path in paths]
+
+    with ThreadPoolExecutor(max_workers=min(len(paths), DEFAULT_CONCURRENCY)) as executor:
+        return list(executor.map(load, paths))
+
+
+def _load_sources(input_dir: Path) -> list[tuple[Path, Any, str | None]]:
+    """
+    Parsed contents of every *.json file in input_dir.
+
+    Shared by batch_summarize and batch_query. Results are cached in
+    process, keyed on each file's name, size and mtime, so repeated loads
+    of unchanged extractions skip JSON parsing. The returned list is
+    shared; don't mutate it.
+    """
+    return _load_sources_cached(input_dir, _sources_signature(input_dir))
+
+
+def _sources_signature(input_dir: Path) -> tuple[tuple[str, int, int], ...]:
+    """(name, size, mtime_ns) of every *.json file in input_dir."""
+    signature = []
+    for path in sorted(input_dir.glob("*.json")):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            # Removed since the glob
+            continue
+        signature.append((path.name, st.st_size, st.st_mtime_ns))
+    return tuple(signature)
+
+
+@lru_cache(maxsize=8)
+def _load_sources_cached(
+    input_dir: Path,
+    signature: tuple[tuple[str, int, int], ...]
+) -> list[tuple[Path, Any, str | None]]:
+    return _load_json_files([input_dir / name for name, _, _ in signature])
+
+
+def _get_session() -> requests.Session:
+    """Return the shared pooled session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+        _SESSION.mount("http://", adapter)
+        _SESSION.mount("https://", adapter)
+        _SESSION.headers["Accept"] = "application/json"
+    return _SESSION
+
+
 def http_request(
     url: str,
     method: str = "GET",
     data: dict | None = None,
     timeout: int = 30
 ) -> tuple[dict | None, str | None]:
-    """Make HTTP request and return (response_data, error)."""
+    """
+    Make HTTP request and return (response_data, error).
+
+    Uses the pooled keep-alive session when requests is installed, so the
+    per-file/per-query LM Studio calls reuse one connection; otherwise
+    falls back to urllib with a new connection per call. Bodies are
+    encoded compactly (orjson when installed) rather than with json's
+    default ", "/": " separators.
+    """
+    body = dumps(data) if data else None
+
+    if REQUESTS_AVAILABLE:
+        try:
+            response = _get_session().request(
+                method, url, data=body, timeout=timeout,
+                headers=_JSON_CONTENT_TYPE if body else None
+            )
+            response.raise_for_status()
+            return loads(response.content) if response.content else {}, None
+        except requests.HTTPError as e:
+            return None, f"HTTP {e.response.status_code}: {e.response.reason}"
+        except requests.RequestException as e:
+            # Also covers InvalidURL/MissingSchema, which subclass ValueError
+            return None, f"Connection error: {e}"
+        except json.JSONDecodeError as e:
+            return None, f"JSON decode error: {e}"
+
     request = Request(url, method=method)
     request.add_header("Accept", "application/json")
     request.add_header("Content-Type", "application/json")
 
-    if data:
-        request.data = json.dumps(data).encode("utf-8")
+    if body:
+        request.data = body
 
     try:
         with urlopen(request, timeout=timeout) as response:
-            body = response.read().decode("utf-8")
-            return json.loads(body) if body else {}, None
+            raw = response.read()
+            return loads(raw) if raw else {}, None
     except HTTPError as e:
         return None, f"HTTP {e.code}: {e.reason}"
     except URLError as e:
@@ -86,40 +312,364 @@ def http_request(
         return None, f"JSON decode error: {e}"
 
 
-def local_llm_process(
+def _chat_payload(
     content: str,
     prompt: str,
-    model: str | None = None,
-    max_tokens: int = 2000
-) -> tuple[str | None, str | None]:
-    """Process content with local LLM via LM Studio."""
-    url = f"{LM_STUDIO_URL}/v1/chat/completions"
+    model: str | None,
+    max_tokens: int,
+    system_prompt: str | None = None
+) -> dict[str, Any]:
+    """
+    Build the /v1/chat/completions request body.
 
+    Large context shared across calls belongs in `system_prompt`: it is the
+    message prefix, so with `cache_prompt` the server reuses its KV cache
+    for every request that repeats it and only evaluates the user turn.
+    """
+    user = f"{prompt}\n\n---\n\n{content}" if content else prompt
     payload = {
         "messages": [
-            {"role": "system", "content": "You are a helpful assistant that analyzes and summarizes content."},
-            {"role": "user", "content": f"{prompt}\n\n---\n\n{content[:15000]}"}  # Truncate for safety
+            {"role": "system", "content": system_prompt or DEFAULT_SYSTEM_PROMPT},
+            {"role": "user", "content": user}
         ],
         "max_tokens": max_tokens,
-        "temperature": 0.3
+        "temperature": 0.3,  # Kept low so cached prefixes/responses stay valid
+        "cache_prompt": True,
+        "stream": True
     }
 
     if model:
         payload["model"] = model
 
-    result, error = http_request(url, method="POST", data=payload, timeout=120)
+    return payload
 
-    if error:
-        return None, error
 
+def _parse_chat_response(result: dict) -> tuple[str | None, str | None]:
+    """Pull the completion text out of a chat completions response."""
     try:
         return result["choices"][0]["message"]["content"], None
-    except (KeyError, IndexError) as e:
+    except (KeyError, IndexError, TypeError) as e:
         return None, f"Invalid response format: {e}"
 
 
+def _collect_stream(lines: Iterable[bytes]) -> tuple[str | None, str | None]:
+    """
+    Join the content deltas of a streamed (SSE) chat completion.
+
+    Falls back to parsing the body as a regular completion if the server
+    ignored `stream` and sent plain JSON.
+    """
+    parts = []
+    raw = []
+    streamed = False
+
+    for line in lines:
+        if not line.startswith(b"data:"):
+            raw.append(line)
+            continue
+
+        streamed = True
+        data = line[5:].strip()
+        if data == b"[DONE]":
+            break
+
+        try:
+            chunk = loads(data)
+        except json.JSONDecodeError as e:
+            return None, f"JSON decode error: {e}"
+        if not isinstance(chunk, dict):
+            return None, f"Invalid response format: expected an object, got {type(chunk).__name__}"
+        if "error" in chunk:
+            return None, f"LLM error: {chunk['error']}"
+
+        try:
+            delta = chunk["choices"][0].get("delta") or {}
+        except (KeyError, IndexError, TypeError, AttributeError) as e:
+            return None, f"Invalid response format: {e}"
+        parts.append(delta.get("content") or "")
+
+    if streamed:
+        return "".join(parts), None
+
+    try:
+        return _parse_chat_response(loads(b"".join(raw)))
+    except json.JSONDecodeError as e:
+        return None, f"JSON decode error: {e}"
+
+
+def _stream_chat(url: str, payload: dict, timeout: int) -> tuple[str | None, str | None]:
+    """POST a streaming chat completion and return (text, error)."""
+    if REQUESTS_AVAILABLE:
+        try:
+            with _get_session().post(url, data=dumps(payload), headers=_JSON_CONTENT_TYPE,
+                                     timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                return _collect_stream(response.iter_lines())
+        except requests.HTTPError as e:
+            return None, f"HTTP {e.response.status_code}: {e.response.reason}"
+        except requests.RequestException as e:
+            return None, f"Connection error: {e}"
+
+    request = Request(url, data=dumps(payload), method="POST")
+    request.add_header("Accept", "text/event-stream")
+    request.add_header("Content-Type", "application/json")
+
+    try:
+        with urlopen(request, timeout=timeout) as response:
+            return _collect_stream(response)
+    except HTTPError as e:
+        return None, f"HTTP {e.code}: {e.reason}"
+    except URLError as e:
+        return None, f"Connection error: {e.reason}"
+    except (OSError, HTTPException) as e:
+        # Timeouts and resets while the stream is being read
+        return None, f"Connection error: {e}"
+
+
+def _llm_request(
+    content: str,
+    prompt: str,
+    model: str | None,
+    max_tokens: int,
+    system_prompt: str | None = None
+) -> tuple[str | None, str | None]:
+    """Send one chat completion request, without caching or truncation."""
+    url = f"{LM_STUDIO_URL}/v1/chat/completions"
+    payload = _chat_payload(content, prompt, model, max_tokens, system_prompt)
+    return _stream_chat(url, payload, timeout=120)
+
+
+def local_llm_process(
+    content: str,
+    prompt: str,
+    model: str | None = None,
+    max_tokens: int = 2000,
+    cache: SemanticCache | None = None,
+    system_prompt: str | None = None,
+    semantic: bool = True
+) -> tuple[str | None, str | None]:
+    """
+    Process content with local LLM via LM Studio.
+
+    Pass context shared by several calls as `system_prompt` (with an empty
+    `content`) so LM Studio can reuse the cached prompt prefix. `content`
+    is truncated to MAX_CONTEXT_TOKENS. `semantic` enables similar-prompt
+    cache hits (see SemanticCache.get_many).
+    """
+    content = truncate_to_tokens(content, MAX_CONTEXT_TOKENS)
+
+    if cache is not None:
+        cached = cache.get(content, prompt, model, system_prompt, semantic)
+        if cached is not None:
+            return cached, None
+
+    response = None
+    try:
+        response, error = _llm_request(content, prompt, model, max_tokens, system_prompt)
+    finally:
+        if cache is not None:
+            if response is not None:
+                cache.put(content, prompt, model, response, system_prompt)
+            else:
+                cache.discard([(content, prompt, model, system_prompt)])
+    return response, error
+
+
+def embed_texts(texts: list[str]) -> list[list[float] | None]:
+    """
+    Embed texts via LM Studio's /v1/embeddings.
+
+    Texts are sent EMBED_BATCH_SIZE at a time as a list input, which the
+    server embeds in one forward pass. Returns one vector per text, None
+    where embedding failed or no embedding model is configured.
+    """
+    vectors: list[list[float] | None] = [None] * len(texts)
+    if not LM_STUDIO_EMBED_MODEL:
+        return vectors
+
+    for start in range(0, len(texts), EMBED_BATCH_SIZE):
+        result, error = http_request(
+            f"{LM_STUDIO_URL}/v1/embeddings",
+            method="POST",
+            data={"model": LM_STUDIO_EMBED_MODEL, "input": texts[start:start + EMBED_BATCH_SIZE]},
+            timeout=60
+        )
+        if error:
+            continue
+
+        try:
+            for position, item in enumerate(result["data"]):
+                vectors[start + item.get("index", position)] = item["embedding"]
+        except (KeyError, IndexError, TypeError):
+            continue
+
+    return vectors
+
+
+def open_cache(ttl_days: float = DEFAULT_TTL_DAYS) -> SemanticCache | None:
+    """Open the response cache, or None if the database can't be opened."""
+    try:
+        return SemanticCache(ttl_days=ttl_days, embed=embed_texts)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: response cache disabled ({e})", file=sys.stderr)
+        return None
+
+
+async def _alocal_llm_process(
+    session: aiohttp.ClientSession,
+    content: str,
+    prompt: str,
+    model: str | None = None,
+    max_tokens: int = 2000,
+    system_prompt: str | None = None
+) -> tuple[str | None, str | None]:
+    """Async variant of local_llm_process on a shared aiohttp session."""
+    url = f"{LM_STUDIO_URL}/v1/chat/completions"
+    payload = _chat_payload(content, prompt, model, max_tokens, system_prompt)
+
+    try:
+        async with session.post(url, data=dumps(payload), headers=_JSON_CONTENT_TYPE,
+                                timeout=aiohttp.ClientTimeout(total=120)) as response:
+            if response.status >= 400:
+                return None, f"HTTP {response.status}: {response.reason}"
+            lines = [line.rstrip(b"\r\n") async for line in response.content]
+    except asyncio.TimeoutError:
+        return None, "Connection error: timed out"
+    except aiohttp.ClientError as e:
+        return None, f"Connection error: {e}"
+
+    return _collect_stream(lines)
+
+
+async def _alocal_llm_batch(
+    jobs: list[LLMJob],
+    model: str | None,
+    concurrency: int,
+    on_result: Callable[[int, tuple[str | None, str | None]], None]
+) -> None:
+    """Run all jobs on one event loop, `concurrency` connections at a time."""
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        async def run(index: int, job: LLMJob) -> None:
+            content, prompt, max_tokens, system_prompt = job
+            # Contain failures to this job so gather() doesn't cancel the rest
+            try:
+                result = await _alocal_llm_process(
+                    session, content, prompt, model, max_tokens, system_prompt
+                )
+            except Exception as e:
+                result = (None, f"Unexpected error: {e}")
+            on_result(index, result)
+
+        await asyncio.gather(*[run(i, job) for i, job in enumerate(jobs)])
+
+
+def local_llm_batch(
+    jobs: list[LLMJob],
+    model: str | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    cache: SemanticCache | None = None,
+    on_result: Callable[[int, tuple[str | None, str | None]], None] | None = None,
+    semantic: bool = True
+) -> list[tuple[str | None, str | None]]:
+    """
+    Process many (content, prompt, max_tokens, system_prompt) jobs with the local LLM.
+    Jobs are sent as given, so callers truncate content up front.
+
+    With a cache, all jobs are looked up first in one get_many call and
+    only the misses are sent to LM Studio; successful responses are then
+    stored. `semantic` enables similar-prompt cache hits; pass False when
+    every job uses the same prompt.
+
+    Keeps up to `concurrency` miss requests in flight so LM Studio can
+    batch them. Uses a single asyncio event loop when aiohttp is
+    installed, otherwise a thread pool over _llm_request. Results are
+    returned in job order.
+
+    `on_result(index, (text, error))` is called on the calling thread as
+    each job finishes, in completion order, so callers can persist
+    results incrementally.
+    """
+    outputs: list[tuple[str | None, str | None]] = [(None, None)] * len(jobs)
+
+    def finish(index: int, result: tuple[str | None, str | None]) -> None:
+        outputs[index] = result
+        if cache is not None and result[0] is not None:
+            content, prompt, _, system_prompt = jobs[index]
+            cache.put(content, prompt, model, result[0], system_prompt)
+        if on_result is not None:
+            on_result(index, result)
+
+    if cache is not None:
+        cached = cache.get_many([
+            (content, prompt, model, system_prompt)
+            for content, prompt, _, system_prompt in jobs
+        ], semantic)
+    else:
+        cached = [None] * len(jobs)
+
+    misses = []
+    for i, response in enumerate(cached):
+        if response is None:
+            misses.append(i)
+        else:
+            outputs[i] = (response, None)
+            if on_result is not None:
+                on_result(i, outputs[i])
+
+    if not misses:
+        return outputs
+
+    pending = [jobs[i] for i in misses]
+    concurrency = max(1, concurrency)
+    try:
+        if AIOHTTP_AVAILABLE:
+            asyncio.run(_alocal_llm_batch(
+                pending, model, concurrency, lambda i, result: finish(misses[i], result)
+            ))
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = {
+                    executor.submit(_llm_request, content, prompt, model, max_tokens, system_prompt): i
+                    for i, (content, prompt, max_tokens, system_prompt) in zip(misses, pending)
+                }
+                for future in as_completed(futures):
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = (None, f"Unexpected error: {e}")
+                    finish(futures[future], result)
+    finally:
+        # Successful misses were stored by finish(); drop the embeddings
+        # held for failed or interrupted jobs
+        if cache is not None:
+            cache.discard([
+                (content, prompt, model, system_prompt)
+                for content, prompt, _, system_prompt in pending
+            ])
+
+    return outputs
+
+
 def check_lm_studio_health() -> tuple[bool, str]:
-    """Check if LM Studio is running and has models loaded."""
+    """
+    Check if LM Studio is running and has models loaded.
+
+    The result is reused for HEALTH_CACHE_TTL seconds, so back-to-back
+    checks within one invocation cost a single /v1/models round-trip.
+    """
+    global _HEALTH_CACHE
+    now = time.monotonic()
+    if _HEALTH_CACHE and now - _HEALTH_CACHE[0] < HEALTH_CACHE_TTL:
+        return _HEALTH_CACHE[1], _HEALTH_CACHE[2]
+
+    healthy, status = _probe_lm_studio()
+    _HEALTH_CACHE = (now, healthy, status)
+    return healthy, status
+
+
+def _probe_lm_studio() -> tuple[bool, str]:
+    """Query /v1/models and describe LM Studio's state."""
     result, error = http_request(f"{LM_STUDIO_URL}/v1/models", timeout=5)
 
     if error:
@@ -172,16 +722,42 @@ def extract_notebook_content(
     )
 
 
+def _padding_ratio(lengths: list[int], batch_size: int) -> float:
+    """
+    Estimate the padded fraction of a batch run.
+
+    Assumes `lengths` are processed `batch_size` at a time in the given
+    order, with each batch padded to its longest input.
+    """
+    padded = 0
+    for i in range(0, len(lengths), batch_size):
+        batch = lengths[i:i + batch_size]
+        padded += max(batch) * len(batch)
+    return 1 - sum(lengths) / padded if padded else 0.0
+
+
 def batch_summarize(
     input_dir: Path,
     output_file: Path,
-    model: str | None = None
+    model: str | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    cache: SemanticCache | None = None,
+    jsonl: bool = False,
+    pretty: bool = False
 ) -> BatchResult:
     """
     Summarize all extracted content using local LLM.
 
     Token savings: Instead of N separate NotebookLM queries (~500 tokens each),
     we use local LLM inference (essentially free).
+
+    Files are submitted `concurrency` at a time, shortest first, so LM
+    Studio can batch similar-length inputs together, and files already
+    summarized on a previous run are served from `cache`.
+    Summaries are appended to a JSONL file as they complete, tagged with
+    their file (name) order index; unless `jsonl` is set, that file is
+    converted to a JSON array in file order at the end (compact unless
+    `pretty`).
     """
     start_time = time.time()
 
@@ -199,72 +775,221 @@ def batch_summarize(
 
     print(f"LM Studio: {status}")
 
-    summaries = []
     errors = []
 
-    # Process each extracted file
-    json_files = list(input_dir.glob("*.json"))
-
-    for json_file in json_files:
+    # Load each extracted file
+    pending = []
+    for json_file, data, load_error in _load_sources(input_dir):
+        if load_error is not None:
+            errors.append(f"{json_file.name}: {load_error}")
+            continue
         try:
-            with open(json_file) as f:
-                data = json.load(f)
-
             content = data.get("content", "")
             title = data.get("title", json_file.stem)
+        except Exception as e:
+            errors.append(f"{json_file.name}: {e}")
+            continue
 
-            if not content:
-                continue
-
-            print(f"Summarizing: {title[:50]}...")
-
-            summary, error = local_llm_process(
-                content,
-                prompt="Provide a concise summary of the following content in 2-3 paragraphs:",
-                model=model
-            )
-
+        if content:
+            pending.append((json_file, title, content))
+
+    prompt = "Provide a concise summary of the following content in 2-3 paragraphs:"
+    jobs = [
+        (truncate_to_tokens(content, MAX_CONTEXT_TOKENS), prompt, 2000, None)
+        for _, _, content in pending
+    ]
+
+    # Submit in order of input length so requests in flight together are
+    # of similar size and LM Studio's batches carry less padding
+    lengths = [len(job[0]) for job in jobs]
+    order = sorted(range(len(jobs)), key=lengths.__getitem__)
+    if len(jobs) > concurrency:
+        before = _padding_ratio(lengths, concurrency)
+        after = _padding_ratio([lengths[i] for i in order], concurrency)
+        print(f"Length bucketing: est. padding {before:.0%} -> {after:.0%} (batches of {concurrency})")
+    jobs = [jobs[i] for i in order]
+
+    for i in order:
+        print(f"Summarizing: {pending[i][1][:50]}...")
+
+    jsonl_path = output_file if jsonl else output_file.with_suffix(".partial.jsonl")
+
+    with _JsonlWriter(jsonl_path) as writer:
+        def on_result(index: int, result: tuple[str | None, str | None]) -> None:
+            # Map back from submission order to file order
+            index = order[index]
+            json_file, title, _ = pending[index]
+            summary, error = result
             if error:
                 errors.append(f"{title}: {error}")
+                writer.add(index, None)
             else:
-                summaries.append({
+                writer.add(index, {
                     "title": title,
                     "summary": summary,
                     "source_file": str(json_file)
                 })
 
-        except Exception as e:
-            errors.append(f"{json_file.name}: {e}")
+        # Requests are I/O-bound, so they are overlapped; records carry their file index.
+        # Every job shares one prompt, so only exact cache hits are possible
+        local_llm_batch(jobs, model, concurrency, cache, on_result, semantic=False)
 
-    # Save combined summaries
-    if summaries:
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, "w") as f:
-            json.dump(summaries, f, indent=2)
+    summarized = writer.count
+    output_path = _finish_output(jsonl_path, output_file, jsonl, summarized, pretty)
 
     return BatchResult(
         operation="summarize",
         success=len(errors) == 0,
-        items_processed=len(summaries),
+        items_processed=summarized,
         items_failed=len(errors),
-        output_path=output_file if summaries else None,
+        output_path=output_path,
         errors=errors,
         duration_seconds=time.time() - start_time,
-        tokens_saved_estimate=len(summaries) * 800  # Each query would cost ~800 tokens
+        tokens_saved_estimate=summarized * 800  # Each query would cost ~800 tokens
     )
 
 
+def _retrieval_index_dir(input_dir: Path) -> Path:
+    """Directory under INDEX_CACHE_DIR holding the index for input_dir."""
+    digest = hashlib.sha256(str(input_dir.resolve()).encode("utf-8")).hexdigest()
+    return INDEX_CACHE_DIR / digest[:16]
+
+
+def _load_retrieval_index(input_dir: Path) -> tuple[tuple[Any, list[dict]] | None, str | None]:
+    """
+    Return the (embeddings, chunks) index for input_dir, building it if needed.
+
+    Sources are split into RETRIEVE_CHUNK_SIZE chunks and embedded once;
+    the unit-normalized float32 matrix is saved as INDEX_FILE with the
+    chunk texts in INDEX_CHUNKS_FILE, under _retrieval_index_dir(). The
+    saved index is reused only while INDEX_MANIFEST_FILE matches the
+    current sources (name, size, mtime), embedding model and chunking
+    settings. If it can't be saved, the in-memory index is still used.
+    """
+    index_dir = _retrieval_index_dir(input_dir)
+    index_path = index_dir / INDEX_FILE
+    chunks_path = index_dir / INDEX_CHUNKS_FILE
+    manifest_path = index_dir / INDEX_MANIFEST_FILE
+
+    signature = _sources_signature(input_dir)
+    manifest = {
+        "sources": [list(entry) for entry in signature],
+        "embed_model": LM_STUDIO_EMBED_MODEL,
+        "chunk_size": RETRIEVE_CHUNK_SIZE,
+        "chunk_overlap": RETRIEVE_CHUNK_OVERLAP,
+    }
+
+    try:
+        with open(manifest_path, "rb") as f:
+            saved_manifest = loads(f.read())
+        if saved_manifest == manifest:
+            index = np.load(index_path)
+            with open(chunks_path, "rb") as f:
+                chunks = [loads(line) for line in f]
+            if len(chunks) == len(index):
+                return (index, chunks), None
+    except (OSError, ValueError):
+        pass
+
+    chunks = []
+    for path, data, load_error in _load_sources_cached(input_dir, signature):
+        if load_error is not None or not isinstance(data, dict):
+            continue
+        title = data.get("title", path.stem)
+        chunks.extend(
+            {"title": title, "text": chunk}
+            for chunk in chunk_text(
+                data.get("content") or "", RETRIEVE_CHUNK_SIZE, RETRIEVE_CHUNK_OVERLAP
+            )
+            if chunk
+        )
+    if not chunks:
+        return None, f"No content to index in {input_dir}"
+
+    print(f"Indexing {len(chunks)} chunks for retrieval...")
+    vectors = embed_texts([chunk["text"] for chunk in chunks])
+    if any(vector is None for vector in vectors):
+        return None, "Embedding failed - check LM_STUDIO_EMBED_MODEL"
+
+    index = np.asarray(vectors, dtype=np.float32)
+    index /= np.maximum(np.linalg.norm(index, axis=1, keepdims=True), 1e-12)
+
+    try:
+        index_dir.mkdir(parents=True, exist_ok=True)
+        # Drop the old manifest first so a partial rewrite is never taken as valid
+        manifest_path.unlink(missing_ok=True)
+        np.save(index_path, index)
+        with open(chunks_path, "wb") as f:
+            f.writelines(dumps(chunk) + b"\n" for chunk in chunks)
+        with open(manifest_path, "wb") as f:
+            f.write(dumps(manifest))
+    except OSError as e:
+        print(f"Warning: retrieval index not saved ({e})", file=sys.stderr)
+
+    return (index, chunks), None
+
+
+def _retrieve_contexts(
+    input_dir: Path,
+    queries: list[str],
+    top_k: int
+) -> tuple[list[str] | None, str | None]:
+    """Assemble each query's context from its top_k most similar chunks."""
+    if not NUMPY_AVAILABLE:
+        return None, "Retrieve mode requires numpy (pip install numpy)"
+    if not LM_STUDIO_EMBED_MODEL:
+        return None, "Retrieve mode requires LM_STUDIO_EMBED_MODEL to be set"
+
+    loaded, error = _load_retrieval_index(input_dir)
+    if error:
+        return None, error
+    index, chunks = loaded
+
+    query_vectors = embed_texts(queries)
+    if any(vector is None for vector in query_vectors):
+        return None, "Embedding failed for one or more queries"
+
+    q_matrix = np.asarray(query_vectors, dtype=np.float32)
+    if q_matrix.shape[1] != index.shape[1]:
+        return None, f"Embedding size changed; delete {_retrieval_index_dir(input_dir)} to rebuild"
+    q_matrix /= np.maximum(np.linalg.norm(q_matrix, axis=1, keepdims=True), 1e-12)
+
+    k = max(1, min(top_k, len(chunks)))
+    contexts = []
+    for sims in q_matrix @ index.T:
+        top = np.argpartition(-sims, k - 1)[:k]
+        top = top[np.argsort(-sims[top])]
+        contexts.append("\n\n---\n\n".join(
+            f"## {chunks[i]['title']}\n\n{chunks[i]['text']}" for i in top
+        ))
+
+    return contexts, None
+
+
 def batch_query(
     input_dir: Path,
     queries: list[str],
     output_file: Path,
-    model: str | None = None
+    model: str | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    cache: SemanticCache | None = None,
+    jsonl: bool = False,
+    pretty: bool = False,
+    mode: str = "cag",
+    top_k: int = RETRIEVE_TOP_K
 ) -> BatchResult:
     """
     Run multiple queries against extracted content using local LLM.
 
     Token savings: Each NotebookLM query costs ~500-1000 tokens.
-    Local processing is essentially free after initial extraction.
+    Local processing is essentially free after initial extraction, and
+    repeated queries are served from `cache` without calling the LLM.
+    Answers are written incrementally as in batch_summarize.
+
+    In "cag" mode every query gets the same combined context from all
+    sources. In "retrieve" mode each query gets only its `top_k` most
+    similar chunks from a per-chunk embedding index, so context per query
+    no longer grows with the number of sources.
     """
     start_time = time.time()
 
@@ -279,51 +1004,70 @@ def batch_query(
             duration_seconds=time.time() - start_time
         )
 
-    # Load all extracted content into memory
-    all_content = []
-    for json_file in input_dir.glob("*.json"):
-        try:
-            with open(json_file) as f:
-                data = json.load(f)
-            all_content.append(f"## {data.get('title', 'Unknown')}\n\n{data.get('content', '')[:5000]}")
-        except Exception:
-            continue
+    if mode == "retrieve":
+        contexts, error = _retrieve_contexts(input_dir, queries, top_k)
+        if error:
+            return BatchResult(
+                operation="query",
+                success=False,
+                items_processed=0,
+                items_failed=0,
+                errors=[error],
+                duration_seconds=time.time() - start_time
+            )
+    else:
+        # Load all extracted content into memory
+        all_content = []
+        for _, data, load_error in _load_sources(input_dir):
+            if load_error is not None:
+                continue
+            try:
+                all_content.append(f"## {data.get('title', 'Unknown')}\n\n{data.get('content', '')[:5000]}")
+            except Exception:
+                continue
 
-    combined_context = "\n\n---\n\n".join(all_content)
+        # One shared context - an identical system-message prefix for every
+        # query - so LM Studio evaluates it once and reuses its KV cache
+        contexts = ["\n\n---\n\n".join(all_content)]
+
+    system_prompts = [
+        f"You are answering based on the following context:\n\n{truncate_to_tokens(context, MAX_CONTEXT_TOKENS)}"
+        for context in contexts
+    ]
 
-    results = []
     errors = []
 
-    for query in queries:
+    jobs = []
+    for i, query in enumerate(queries):
         print(f"Processing query: {query[:50]}...")
+        jobs.append(("", query, 1500, system_prompts[i if mode == "retrieve" else 0]))
 
-        answer, error = local_llm_process(
-            combined_context,
-            prompt=f"Based on the following context, answer this question:\n\n{query}",
-            model=model,
-            max_tokens=1500
-        )
+    jsonl_path = output_file if jsonl else output_file.with_suffix(".partial.jsonl")
 
-        if error:
-            errors.append(f"Query '{query[:30]}...': {error}")
-        else:
-            results.append({
-                "query": query,
-                "answer": answer
-            })
+    with _JsonlWriter(jsonl_path) as writer:
+        def on_result(index: int, result: tuple[str | None, str | None]) -> None:
+            query = queries[index]
+            answer, error = result
+            if error:
+                errors.append(f"Query '{query[:30]}...': {error}")
+                writer.add(index, None)
+            else:
+                writer.add(index, {
+                    "query": query,
+                    "answer": answer
+                })
+
+        local_llm_batch(jobs, model, concurrency, cache, on_result)
 
-    # Save results
-    if results:
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, "w") as f:
-            json.dump(results, f, indent=2)
+    answered = writer.count
+    output_path = _finish_output(jsonl_path, output_file, jsonl, answered, pretty)
 
     return BatchResult(
         operation="query",
         success=len(errors) == 0,
-        items_processed=len(results),
+        items_processed=answered,
         items_failed=len(errors),
-        output_path=output_file if results else None,
+        output_path=output_path,
         errors=errors,
         duration_seconds=time.time() - start_time,
         tokens_saved_estimate=len(queries) * 1000  # Each cloud query ~1000 tokens
@@ -348,8 +1092,9 @@ def generate_status_json() -> dict[str, Any]:
     }
 
 
-def main() -> int:
-    """CLI entry point."""
+@lru_cache(maxsize=1)
+def _parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once per process."""
     parser = argparse.ArgumentParser(
         description="NotebookLM Batch Processor - Token Optimization",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -373,21 +1118,75 @@ Examples:
     # Summarize command
     summarize_parser = subparsers.add_parser("summarize", help="Summarize extracted content locally")
     summarize_parser.add_argument("--input", "-i", type=Path, required=True)
-    summarize_parser.add_argument("--output", "-o", type=Path, default=Path("summaries.json"))
+    summarize_parser.add_argument("--output", "-o", type=Path,
+                                  help="Output file (default: summaries.json, or summaries.jsonl with --jsonl)")
     summarize_parser.add_argument("--model", "-m", help="LM Studio model to use")
+    summarize_parser.add_argument("--concurrency", "-c", type=int, default=DEFAULT_CONCURRENCY,
+                                  help=f"Concurrent LM Studio requests (default: {DEFAULT_CONCURRENCY})")
+    summarize_parser.add_argument("--no-cache", action="store_true", help="Bypass the response cache")
+    summarize_parser.add_argument("--cache-ttl-days", type=float, default=DEFAULT_TTL_DAYS,
+                                  help=f"Ignore cached responses older than this (default: {DEFAULT_TTL_DAYS})")
+    summarize_parser.add_argument("--jsonl", action="store_true",
+                                  help="Keep incremental JSON Lines output instead of a JSON array")
+    summarize_parser.add_argument("--pretty", action="store_true", help="Indent the JSON array output")
 
     # Query command
     query_parser = subparsers.add_parser("query", help="Query extracted content locally")
     query_parser.add_argument("--input", "-i", type=Path, required=True)
     query_parser.add_argument("--queries", "-q", nargs="+", required=True)
-    query_parser.add_argument("--output", "-o", type=Path, default=Path("query_results.json"))
+    query_parser.add_argument("--output", "-o", type=Path,
+                              help="Output file (default: query_results.json, or query_results.jsonl with --jsonl)")
     query_parser.add_argument("--model", "-m", help="LM Studio model to use")
+    query_parser.add_argument("--concurrency", "-c", type=int, default=DEFAULT_CONCURRENCY,
+                              help=f"Concurrent LM Studio requests (default: {DEFAULT_CONCURRENCY})")
+    query_parser.add_argument("--no-cache", action="store_true", help="Bypass the response cache")
+    query_parser.add_argument("--cache-ttl-days", type=float, default=DEFAULT_TTL_DAYS,
+                              help=f"Ignore cached responses older than this (default: {DEFAULT_TTL_DAYS})")
+    query_parser.add_argument("--jsonl", action="store_true",
+                              help="Keep incremental JSON Lines output instead of a JSON array")
+    query_parser.add_argument("--pretty", action="store_true", help="Indent the JSON array output")
+    query_parser.add_argument("--mode", choices=["cag", "retrieve"], default="cag",
+                              help="cag: all sources as context; retrieve: top-K similar chunks per query")
+    query_parser.add_argument("--top-k", type=int, default=RETRIEVE_TOP_K,
+                              help=f"Chunks per query in retrieve mode (default: {RETRIEVE_TOP_K})")
 
     # Status command
     status_parser = subparsers.add_parser("status", help="Check service status")
     status_parser.add_argument("--json", action="store_true", help="Output as JSON")
 
-    args = parser.parse_args()
+    return parser
+
+
+def _run_extract(args: argparse.Namespace) -> BatchResult:
+    return extract_notebook_content(args.notebook, args.output, args.sources)
+
+
+def _run_summarize(args: argparse.Namespace) -> BatchResult:
+    cache = None if args.no_cache else open_cache(args.cache_ttl_days)
+    output = args.output or Path("summaries.jsonl" if args.jsonl else "summaries.json")
+    return batch_summarize(args.input, output, args.model, args.concurrency,
+                           cache, args.jsonl, args.pretty)
+
+
+def _run_query(args: argparse.Namespace) -> BatchResult:
+    cache = None if args.no_cache else open_cache(args.cache_ttl_days)
+    output = args.output or Path("query_results.jsonl" if args.jsonl else "query_results.json")
+    return batch_query(args.input, args.queries, output, args.model, args.concurrency,
+                       cache, args.jsonl, args.pretty, args.mode, args.top_k)
+
+
+# Commands producing a BatchResult; "status" is handled separately in main()
+COMMANDS: dict[str, Callable[[argparse.Namespace], BatchResult]] = {
+    "extract": _run_extract,
+    "summarize": _run_summarize,
+    "query": _run_query,
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point."""
+    parser = _parser()
+    args = parser.parse_args(argv)
 
     if args.command == "status":
         status = generate_status_json()
@@ -398,18 +1197,11 @@ Examples:
             print(f"  {status['lm_studio']['status']}")
         return 0 if status['lm_studio']['healthy'] else 1
 
-    elif args.command == "extract":
-        result = extract_notebook_content(args.notebook, args.output, args.sources)
-
-    elif args.command == "summarize":
-        result = batch_summarize(args.input, args.output, getattr(args, 'model', None))
-
-    elif args.command == "query":
-        result = batch_query(args.input, args.queries, args.output, getattr(args, 'model', None))
-
-    else:
+    command = COMMANDS.get(args.command)
+    if command is None:
         parser.print_help()
         return 1
+    result = command(args)
 
     # Print result summary
     print(f"\n{'='*50}")
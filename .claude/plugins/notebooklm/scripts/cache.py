@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Semantic response cache for local LLM calls.
+
+Stores LM Studio responses in a local SQLite database so repeated batch
+runs over the same content skip inference entirely. Lookups try an exact
+key first - sha256 of model, system prompt, prompt and content - and then,
+when an embedding function is supplied and the caller opts in with
+semantic=True, fall back to the cached request whose prompt is most
+similar (cosine >= threshold) for the same model, system prompt and
+content, i.e. a reworded prompt over identical input. Callers that always
+send the same prompt (e.g. summarize) pass semantic=False and skip the
+embedding round trip.
+
+Usage:
+    from cache import SemanticCache
+
+    cache = SemanticCache(ttl_days=7)
+    response = cache.get(content, prompt, model)      # or get_many([...])
+    if response is None:
+        response = ...  # call the LLM
+        cache.put(content, prompt, model, response)
+
+Environment Variables:
+    NOTEBOOKLM_CACHE_PATH - SQLite file (default: ~/.cache/notebooklm/llm_cache.sqlite3)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Callable, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Configuration
+DEFAULT_CACHE_PATH = Path(os.environ.get(
+    "NOTEBOOKLM_CACHE_PATH",
+    Path.home() / ".cache" / "notebooklm" / "llm_cache.sqlite3"
+))
+DEFAULT_TTL_DAYS = 30
+SIMILARITY_THRESHOLD = 0.95
+# Most recent rows compared on an exact-key miss
+MAX_SCAN_ROWS = 2000
+# Keys per IN (...) query, below SQLite's bound-parameter limit
+_SQL_BATCH = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,  -- similarity scope, see _scope()
+    embedding BLOB,
+    response TEXT NOT NULL,
+    ts INTEGER NOT NULL
+)
+"""
+
+
+def cache_key(
+    content: str,
+    prompt: str,
+    model: str | None,
+    system_prompt: str | None = None
+) -> str:
+    """Exact-match key for a request."""
+    digest = hashlib.sha256()
+    for part in (model or "", system_prompt or "", prompt, content):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _scope(model: str | None, system_prompt: str | None, content: str) -> str:
+    """
+    Partition for similarity lookups: the model, plus a digest of the
+    system prompt and content when either is set, so a semantic hit is only
+    taken from requests made against the same context and the same input.
+    Only the prompt is embedded, so the content must match exactly.
+    """
+    if not system_prompt and not content:
+        return model or ""
+    digest = hashlib.sha256()
+    for part in (system_prompt or "", content):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return f"{model or ''}#{digest.hexdigest()[:16]}"
+
+
+def _cosine(a: Sequence[float], b: Sequence[float]) -> float:
+    """Cosine similarity of two vectors (pure Python fallback)."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class SemanticCache:
+    """SQLite-backed LLM response cache with embedding-similarity fallback."""
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_CACHE_PATH,
+        ttl_days: float = DEFAULT_TTL_DAYS,
+        threshold: float = SIMILARITY_THRESHOLD,
+        embed: Callable[[list[str]], list[Sequence[float] | None]] | None = None
+    ):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file
+            ttl_days: Entries older than this are ignored and purged
+            threshold: Minimum cosine similarity for a semantic hit
+            embed: Optional function returning an embedding per text for a
+                list of texts (None where unavailable); without it only
+                exact matches are served
+        """
+        self.path = Path(path)
+        self.ttl_seconds = int(ttl_days * 86400)
+        self.threshold = threshold
+        self.embed = embed
+        self.hits = 0
+        self.misses = 0
+
+        # Embeddings computed on a miss, reused when the response is stored
+        # (put) or dropped when the request fails (discard)
+        self._pending: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.execute("DELETE FROM responses WHERE ts < ?", (self._cutoff(),))
+        self._conn.commit()
+
+    def _cutoff(self) -> int:
+        return int(time.time()) - self.ttl_seconds
+
+    def get(
+        self,
+        content: str,
+        prompt: str,
+        model: str | None = None,
+        system_prompt: str | None = None,
+        semantic: bool = True
+    ) -> str | None:
+        """Return a cached response for the request, or None on a miss."""
+        return self.get_many([(content, prompt, model, system_prompt)], semantic)[0]
+
+    def get_many(
+        self,
+        requests: Sequence[tuple[str, str, str | None, str | None]],
+        semantic: bool = True
+    ) -> list[str | None]:
+        """
+        Look up many (content, prompt, model, system_prompt) requests at once.
+
+        Exact keys are fetched in bulk. With `semantic`, the prompts of the
+        remaining requests are embedded with a single `embed` call and
+        scored against the cached embeddings with one matrix product per
+        scope; pass False when the prompt never varies, as no semantic hit
+        is possible then.
+
+        Returns:
+            Cached response per request, None where there was no hit
+        """
+        keys = [cache_key(*request) for request in requests]
+        found: dict[str, str] = {}
+        with self._lock:
+            for i in range(0, len(keys), _SQL_BATCH):
+                batch = keys[i:i + _SQL_BATCH]
+                found.update(self._conn.execute(
+                    "SELECT key, response FROM responses "
+                    f"WHERE ts >= ? AND key IN ({','.join('?' * len(batch))})",
+                    (self._cutoff(), *batch)
+                ).fetchall())
+
+        responses = [found.get(key) for key in keys]
+        misses = [i for i, response in enumerate(responses) if response is None]
+
+        if misses and semantic and self.embed is not None:
+            vectors = self.embed([requests[i][1] for i in misses])
+
+            by_scope: dict[str, list[tuple[int, array]]] = {}
+            pending = {}
+            for i, vector in zip(misses, vectors):
+                if not vector:
+                    continue
+                query = array("f", vector)
+                pending[keys[i]] = query.tobytes()
+                content, _, model, system_prompt = requests[i]
+                by_scope.setdefault(_scope(model, system_prompt, content), []).append((i, query))
+            with self._lock:
+                self._pending.update(pending)
+
+            for scope, queries in by_scope.items():
+                matches = self._best_matches(scope, [query for _, query in queries])
+                for (i, _), response in zip(queries, matches):
+                    responses[i] = response
+
+        hits = sum(response is not None for response in responses)
+        self.hits += hits
+        self.misses += len(responses) - hits
+        return responses
+
+    def _best_matches(self, scope: str, queries: list[array]) -> list[str | None]:
+        """Closest cached response per query embedding, if similar enough."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT embedding, response FROM responses "
+                "WHERE model = ? AND ts >= ? AND embedding IS NOT NULL "
+                "ORDER BY ts DESC LIMIT ?",
+                (scope, self._cutoff(), MAX_SCAN_ROWS)
+            ).fetchall()
+
+        results: list[str | None] = [None] * len(queries)
+        by_dim: dict[int, list[int]] = {}
+        for q, query in enumerate(queries):
+            by_dim.setdefault(len(query), []).append(q)
+
+        for dim, members in by_dim.items():
+            candidates = [row for row in rows if len(row[0]) == dim * 4]
+            if not candidates:
+                continue
+
+            if NUMPY_AVAILABLE:
+                # Stored vectors are raw float32, so frombuffer reads them without copying
+                matrix = np.frombuffer(b"".join(row[0] for row in candidates), dtype=np.float32)
+                matrix = matrix.reshape(len(candidates), dim)
+                q_matrix = np.frombuffer(
+                    b"".join(queries[q].tobytes() for q in members), dtype=np.float32
+                ).reshape(len(members), dim)
+                norms = np.outer(np.linalg.norm(q_matrix, axis=1), np.linalg.norm(matrix, axis=1))
+                sims = (q_matrix @ matrix.T) / np.where(norms == 0, 1, norms)
+                best = sims.argmax(axis=1)
+                scores = sims[np.arange(len(members)), best]
+                picks = zip(members, best.tolist(), scores.tolist())
+            else:
+                picks = []
+                for q in members:
+                    sims = [_cosine(array("f", row[0]), queries[q]) for row in candidates]
+                    top = max(range(len(sims)), key=sims.__getitem__)
+                    picks.append((q, top, sims[top]))
+
+            for q, top, score in picks:
+                if score >= self.threshold:
+                    results[q] = candidates[top][1]
+
+        return results
+
+    def put(
+        self,
+        content: str,
+        prompt: str,
+        model: str | None,
+        response: str,
+        system_prompt: str | None = None
+    ) -> None:
+        """Store a response for the request."""
+        key = cache_key(content, prompt, model, system_prompt)
+        with self._lock:
+            embedding = self._pending.pop(key, None)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, embedding, response, ts) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, _scope(model, system_prompt, content), embedding, response, int(time.time()))
+            )
+            self._conn.commit()
+
+    def discard(
+        self,
+        requests: Sequence[tuple[str, str, str | None, str | None]]
+    ) -> None:
+        """
+        Forget embeddings held for (content, prompt, model, system_prompt)
+        requests that will not be stored, e.g. because the LLM call failed.
+        """
+        with self._lock:
+            for request in requests:
+                self._pending.pop(cache_key(*request), None)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
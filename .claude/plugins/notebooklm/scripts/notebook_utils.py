@@ -14,10 +14,30 @@ from __future__ import annotations
 import json
 import re
 from dataclasses import dataclass
-from typing import Any
-
-
-@dataclass
+from functools import lru_cache
+from typing import Any, Iterable, Iterator
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# Approximate characters per token, used when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+# Upper bound on characters per token, so only a bounded prefix is tokenized
+MAX_CHARS_PER_TOKEN = 8
+
+# Patterns used by clean_text, compiled once at import
+_RE_NEWLINES = re.compile(r'\n{3,}')
+_RE_SPACES = re.compile(r' {2,}')
+_RE_BRACKETS = re.compile(r'\[.*?\]')
+# Sentence end (terminal punctuation + whitespace), spelled backwards:
+# searching the reversed window finds the rightmost boundary in one pass
+_RE_SENTENCE_END_REVERSED = re.compile(r'\s[.?!]')
+
+
+@dataclass(slots=True)
 class NotebookSource:
     """Represents a source from a NotebookLM notebook."""
     id: str
@@ -45,7 +65,7 @@ class NotebookSource:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class NotebookInfo:
     """Represents a NotebookLM notebook."""
     id: str
@@ -66,107 +86,185 @@ class NotebookInfo:
 def clean_text(text: str) -> str:
     """Clean extracted text content."""
     # Remove excessive whitespace
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    text = re.sub(r' {2,}', ' ', text)
+    text = _RE_NEWLINES.sub('\n\n', text)
+    text = _RE_SPACES.sub(' ', text)
 
     # Remove common artifacts
-    text = re.sub(r'\[.*?\]', '', text)  # Remove bracketed references
+    text = _RE_BRACKETS.sub('', text)  # Remove bracketed references
 
     return text.strip()
 
 
-def chunk_text(
+@lru_cache(maxsize=1)
+def _token_encoding() -> Any:
+    """Load the cl100k_base encoding once, or None if it can't be loaded."""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # The encoding file is downloaded on first use; offline, fall back
+        return None
+
+
+def truncate_to_tokens(text: str, budget: int) -> str:
+    """
+    Truncate text to at most `budget` tokens.
+
+    Counts with tiktoken's cl100k_base encoding when available - close to,
+    though not exactly, the local model's tokenizer - and otherwise falls
+    back to `budget * CHARS_PER_TOKEN` characters. Only the first
+    `budget * MAX_CHARS_PER_TOKEN` characters are tokenized, so long
+    documents don't pay for encoding text that is cut anyway.
+
+    Args:
+        text: Text to truncate
+        budget: Maximum number of tokens
+
+    Returns:
+        The text, cut at a token boundary if it was over budget
+    """
+    encoding = _token_encoding()
+    if encoding is None:
+        return text[:budget * CHARS_PER_TOKEN]
+
+    head = text[:budget * MAX_CHARS_PER_TOKEN]
+    tokens = encoding.encode(head, disallowed_special=())
+    if len(tokens) > budget:
+        return encoding.decode(tokens[:budget])
+    return head
+
+
+def iter_chunks(
     text: str,
     chunk_size: int = 4000,
     overlap: int = 200
-) -> list[str]:
+) -> Iterator[str]:
     """
-    Split text into chunks for processing.
+    Lazily split text into chunks for processing.
+
+    Same chunks as chunk_text, yielded one at a time so very large inputs
+    can be streamed without materializing every chunk.
 
     Args:
         text: Text to chunk
         chunk_size: Target size per chunk
         overlap: Overlap between chunks
 
-    Returns:
-        List of text chunks
+    Yields:
+        Text chunks
     """
     if len(text) <= chunk_size:
-        return [text]
+        yield text
+        return
 
-    chunks = []
     start = 0
 
-    while start < len(text):
+    while True:
         end = start + chunk_size
 
-        # Try to break at sentence boundary
-        if end < len(text):
-            # Look for sentence end within last 200 chars
-            search_start = max(end - 200, start)
-            sentence_end = -1
+        if end >= len(text):
+            # Final chunk; anything after it would repeat its overlap
+            yield text[start:].strip()
+            return
 
-            for pattern in ['. ', '.\n', '? ', '!\n']:
-                pos = text.rfind(pattern, search_start, end)
-                if pos > sentence_end:
-                    sentence_end = pos + 1
+        # Try to break at the last sentence end within the final 200 chars,
+        # as long as the next chunk still starts after this one
+        match = _RE_SENTENCE_END_REVERSED.search(text[max(end - 200, start):end][::-1])
+        if match and end - match.start() - 1 - overlap > start:
+            end = end - match.start() - 1
 
-            if sentence_end > start:
-                end = sentence_end
+        yield text[start:end].strip()
+        start = max(end - overlap, start + 1)
 
-        chunks.append(text[start:end].strip())
-        start = end - overlap
 
-    return chunks
+def chunk_text(
+    text: str,
+    chunk_size: int = 4000,
+    overlap: int = 200
+) -> list[str]:
+    """
+    Split text into chunks for processing.
 
+    Args:
+        text: Text to chunk
+        chunk_size: Target size per chunk
+        overlap: Overlap between chunks
 
-def format_for_embedding(
-    sources: list[NotebookSource],
+    Returns:
+        List of text chunks
+    """
+    return list(iter_chunks(text, chunk_size, overlap))
+
+
+def iter_for_embedding(
+    sources: Iterable[NotebookSource],
     include_metadata: bool = True
-) -> list[dict[str, Any]]:
+) -> Iterator[dict[str, Any]]:
     """
-    Format sources for embedding with LM Studio.
+    Lazily format sources for embedding with LM Studio.
+
+    Yields the same documents as format_for_embedding one source at a
+    time, so embedding clients can stream-batch large notebooks. All
+    chunks of a source share one metadata dict.
 
     Args:
-        sources: List of NotebookSource objects
+        sources: NotebookSource objects
         include_metadata: Include source metadata
 
-    Returns:
-        List of documents ready for embedding
+    Yields:
+        Documents ready for embedding
     """
-    documents = []
-
     for source in sources:
         if not source.content:
             continue
 
         # Chunk large content
         chunks = chunk_text(source.content)
-
-        for i, chunk in enumerate(chunks):
-            doc = {
-                "text": chunk,
-                "source_id": source.id,
-                "chunk_index": i,
-                "total_chunks": len(chunks)
+        source_id = source.id
+        total = len(chunks)
+
+        if include_metadata:
+            meta = {
+                "title": source.title,
+                "type": source.source_type,
+                "url": source.url
             }
+            yield from (
+                {"text": chunk, "source_id": source_id, "chunk_index": i,
+                 "total_chunks": total, "metadata": meta}
+                for i, chunk in enumerate(chunks)
+            )
+        else:
+            yield from (
+                {"text": chunk, "source_id": source_id, "chunk_index": i,
+                 "total_chunks": total}
+                for i, chunk in enumerate(chunks)
+            )
 
-            if include_metadata:
-                doc["metadata"] = {
-                    "title": source.title,
-                    "type": source.source_type,
-                    "url": source.url
-                }
 
-            documents.append(doc)
+def format_for_embedding(
+    sources: list[NotebookSource],
+    include_metadata: bool = True
+) -> list[dict[str, Any]]:
+    """
+    Format sources for embedding with LM Studio.
 
-    return documents
+    Args:
+        sources: List of NotebookSource objects
+        include_metadata: Include source metadata
+
+    Returns:
+        List of documents ready for embedding
+    """
+    return list(iter_for_embedding(sources, include_metadata))
 
 
 def format_for_lm_studio(
     content: str,
     system_prompt: str | None = None,
-    max_context: int = 8000
+    max_context: int = 8000,
+    max_context_tokens: int | None = None
 ) -> dict[str, Any]:
     """
     Format content for LM Studio API request.
@@ -174,7 +272,9 @@ def format_for_lm_studio(
     Args:
         content: Content to process
         system_prompt: Optional system prompt
-        max_context: Maximum context length
+        max_context: Maximum context length in characters
+        max_context_tokens: Maximum context length in tokens; overrides
+            max_context when set
 
     Returns:
         Request body for LM Studio
@@ -188,7 +288,11 @@ def format_for_lm_studio(
         })
 
     # Truncate content if needed
-    if len(content) > max_context:
+    if max_context_tokens is not None:
+        truncated = truncate_to_tokens(content, max_context_tokens)
+        if len(truncated) < len(content):
+            content = truncated + "\n\n[Content truncated...]"
+    elif len(content) > max_context:
         content = content[:max_context] + "\n\n[Content truncated...]"
 
     messages.append({
@@ -339,8 +443,11 @@ __all__ = [
     "NotebookInfo",
     "clean_text",
     "chunk_text",
+    "iter_chunks",
     "format_for_embedding",
+    "iter_for_embedding",
     "format_for_lm_studio",
+    "truncate_to_tokens",
     "create_research_summary",
     "create_n8n_webhook_payload",
     "parse_notebook_response",
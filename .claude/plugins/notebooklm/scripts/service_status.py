@@ -9,6 +9,11 @@ Usage:
     python service_status.py              # Human-readable output
     python service_status.py --compact    # Single-line for hook injection
     python service_status.py --json       # Full JSON output
+    python service_status.py --json --pretty  # Indented JSON
+    python service_status.py --no-cache   # Always probe services
+
+Results are cached for a few seconds under $XDG_CACHE_HOME/arthur_rag so
+back-to-back hook invocations share one probe.
 
 Exit codes:
     0 - All services healthy
@@ -18,32 +23,90 @@ Exit codes:
 
 from __future__ import annotations
 
-import argparse
+import calendar
 import json
 import os
+import re
 import sys
 import time
+from datetime import datetime
 from pathlib import Path
 from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+from _auth_cache import load_auth
+from _json_utils import dumps, loads, write_json_atomic
 
 
 # Service configuration
 LM_STUDIO_URL = os.environ.get("LM_STUDIO_URL", "http://localhost:1234")
 NOTEBOOKLM_AUTH_PATH = Path.home() / ".notebooklm-mcp" / "auth.json"
 
+# Status cache (seconds a result stays fresh, per output mode)
+STATUS_CACHE_PATH = Path(
+    os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+) / "arthur_rag" / "service_status.json"
+COMPACT_CACHE_TTL = 10
+DEFAULT_CACHE_TTL = 30
+# Last "authenticated" auth-file check, reused while the file is unchanged
+AUTH_CACHE_PATH = STATUS_CACHE_PATH.with_name("nb_auth.json")
+AUTH_CACHE_TTL = 3600
+
+# UTC timestamps as written by the auth tool, e.g. 2026-01-31T12:00:00.123Z
+_RE_UTC_TIMESTAMP = re.compile(r"(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)(\.\d+)?Z$")
+
+
+def http_get(
+    url: str,
+    timeout: int = 3,
+    validators: dict[str, str] | None = None
+) -> tuple[dict | None, str | None]:
+    """
+    Quick HTTP GET with timeout.
+
+    Args:
+        url: URL to fetch
+        timeout: Seconds before giving up
+        validators: Optional "etag"/"last_modified" from a previous response,
+            sent as a conditional request and replaced in place with the
+            new response's values
+
+    Returns:
+        Tuple of (parsed body, error); (None, None) when the server answered
+        304 Not Modified
+    """
+    # Imported here: urllib.request dominates start-up and is only needed
+    # when the cached status has expired
+    from urllib.error import HTTPError, URLError
+    from urllib.request import Request, urlopen
 
-def http_get(url: str, timeout: int = 3) -> tuple[dict | None, str | None]:
-    """Quick HTTP GET with timeout."""
     request = Request(url)
     request.add_header("Accept", "application/json")
+    request.add_header("Connection", "keep-alive")
+    if validators:
+        if validators.get("etag"):
+            request.add_header("If-None-Match", validators["etag"])
+        if validators.get("last_modified"):
+            request.add_header("If-Modified-Since", validators["last_modified"])
 
     try:
         with urlopen(request, timeout=timeout) as response:
-            body = response.read().decode("utf-8")
-            return json.loads(body) if body else {}, None
+            if validators is not None:
+                validators.clear()
+                if response.headers.get("ETag"):
+                    validators["etag"] = response.headers["ETag"]
+                if response.headers.get("Last-Modified"):
+                    validators["last_modified"] = response.headers["Last-Modified"]
+            body = response.read()
+            return loads(body) if body else {}, None
     except HTTPError as e:
+        if e.code == 304 and validators:
+            return None, None
         return None, f"HTTP {e.code}"
     except URLError as e:
         return None, str(e.reason)[:30]
@@ -51,9 +114,26 @@ def http_get(url: str, timeout: int = 3) -> tuple[dict | None, str | None]:
         return None, str(e)[:30]
 
 
-def check_lm_studio() -> dict[str, Any]:
-    """Check LM Studio health and loaded models."""
-    result, error = http_get(f"{LM_STUDIO_URL}/v1/models")
+def check_lm_studio(http_cache: dict[str, Any] | None = None) -> dict[str, Any]:
+    """
+    Check LM Studio health and loaded models.
+
+    Args:
+        http_cache: Previous "result" with its "validators", updated in
+            place; the model list is fetched conditionally and, if the server
+            reports it unchanged (304), the previous result is reused
+            without downloading or parsing it again
+    """
+    validators = None
+    if http_cache is not None:
+        validators = dict(http_cache.get("validators") or {}) if http_cache.get("result") else {}
+
+    result, error = http_get(f"{LM_STUDIO_URL}/v1/models", validators=validators)
+    if result is None and error is None:
+        return http_cache["result"]
+
+    if http_cache is not None:
+        http_cache.clear()
 
     if error:
         return {
@@ -66,11 +146,16 @@ def check_lm_studio() -> dict[str, Any]:
     models = result.get("data", [])
     model_ids = [m.get("id", "?") for m in models]
 
-    # Check for chat and embedding models
-    has_chat = any("embed" not in m.lower() for m in model_ids)
-    has_embedding = any("embed" in m.lower() for m in model_ids)
+    # Check for chat and embedding models in one pass
+    has_chat = has_embedding = False
+    for model_id in model_ids:
+        is_embed = "embed" in model_id.lower()
+        has_embedding |= is_embed
+        has_chat |= not is_embed
+        if has_chat and has_embedding:
+            break
 
-    return {
+    status = {
         "service": "lm_studio",
         "status": "healthy" if models else "no_models",
         "models": model_ids[:3],  # First 3 models
@@ -78,51 +163,111 @@ def check_lm_studio() -> dict[str, Any]:
         "has_chat": has_chat,
         "has_embedding": has_embedding
     }
-
-
-def check_notebooklm_auth() -> dict[str, Any]:
-    """Check NotebookLM authentication status."""
-    if not NOTEBOOKLM_AUTH_PATH.exists():
-        return {
-            "service": "notebooklm",
-            "status": "no_auth",
-            "error": "Auth file not found"
-        }
-
+    if http_cache is not None and validators:
+        http_cache.update(validators=validators, result=status)
+    return status
+
+
+# Parse errors raised by the streaming reader
+_IJSON_ERRORS: tuple[type[Exception], ...] = (ijson.JSONError,) if IJSON_AVAILABLE else ()
+
+
+def _scan_auth_file(path: Path) -> tuple[bool, Any]:
+    """
+    Read only what the status check needs from an auth file.
+
+    With ijson the file is streamed and the cookies are never assembled
+    into a parsed structure; otherwise the shared load_auth() parse is
+    used. Either way the whole file is parsed, so a truncated or corrupt
+    file raises a decode error.
+
+    Returns:
+        Tuple of (cookies present and non-empty, expires_at value or None)
+    """
+    if not IJSON_AVAILABLE:
+        auth_data = load_auth(path)
+        if auth_data is None and not path.exists():
+            raise FileNotFoundError(f"Auth file not found: {path}")
+        if not isinstance(auth_data, dict):
+            # Same answer as the streaming path, which finds no top-level keys
+            return False, None
+        return bool(auth_data.get("cookies", "")), auth_data.get("expires_at")
+
+    has_cookies: bool | None = None
+    expires_at = None
+    key = None  # top-level key whose value is next in the stream
+
+    with open(path, "rb") as f:
+        events = ijson.parse(f)
+        # Read to the end rather than stopping once both values are known,
+        # so the file is validated as fully as by json.load
+        for prefix, event, value in events:
+            if prefix == "" and event == "map_key":
+                key = value
+                continue
+            if key == "cookies":
+                if event in ("start_array", "start_map"):
+                    # Non-empty unless the container closes immediately
+                    _, event, _ = next(events)
+                    has_cookies = event not in ("end_array", "end_map")
+                else:
+                    has_cookies = bool(value)
+            elif key == "expires_at":
+                expires_at = value
+            key = None
+
+    return bool(has_cookies), expires_at
+
+
+def _parse_expiry(expires_at: str) -> float:
+    """Convert an ISO 8601 expiry time to epoch seconds."""
+    match = _RE_UTC_TIMESTAMP.match(expires_at)
+    if match:
+        fraction = float(match[7]) if match[7] else 0.0
+        return calendar.timegm(tuple(map(int, match.groups()[:6]))) + fraction
+    # Offsets and other layouts; naive times are taken as local time
+    return datetime.fromisoformat(expires_at.replace("Z", "+00:00")).timestamp()
+
+
+def _check_auth_file() -> tuple[dict[str, Any], float | None]:
+    """
+    Check the NotebookLM auth file's contents.
+
+    Returns:
+        Tuple of (status, epoch time at which an "authenticated" status
+        enters the expiring-soon window, or None if the file has no expiry)
+    """
     try:
-        with open(NOTEBOOKLM_AUTH_PATH) as f:
-            auth_data = json.load(f)
+        has_cookies, expires_at = _scan_auth_file(NOTEBOOKLM_AUTH_PATH)
 
         # Check if cookies exist
-        cookies = auth_data.get("cookies", "")
-        if not cookies:
+        if not has_cookies:
             return {
                 "service": "notebooklm",
                 "status": "invalid_auth",
                 "error": "No cookies in auth file"
-            }
+            }, None
 
         # Check expiry if available
-        expires_at = auth_data.get("expires_at")
+        expiring_at = None
         if expires_at:
             try:
-                from datetime import datetime
-                exp_time = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
-                now = datetime.now(exp_time.tzinfo)
-                days_left = (exp_time - now).days
+                exp_epoch = _parse_expiry(expires_at)
+                days_left = int((exp_epoch - time.time()) // 86400)
 
                 if days_left < 0:
                     return {
                         "service": "notebooklm",
                         "status": "expired",
                         "days_expired": abs(days_left)
-                    }
+                    }, None
                 elif days_left < 3:
                     return {
                         "service": "notebooklm",
                         "status": "expiring_soon",
                         "days_left": days_left
-                    }
+                    }, None
+                expiring_at = exp_epoch - 3 * 86400
             except Exception:
                 pass
 
@@ -130,26 +275,85 @@ def check_notebooklm_auth() -> dict[str, Any]:
             "service": "notebooklm",
             "status": "authenticated",
             "auth_file": str(NOTEBOOKLM_AUTH_PATH)
-        }
+        }, expiring_at
 
-    except json.JSONDecodeError:
+    except (json.JSONDecodeError, *_IJSON_ERRORS):
         return {
             "service": "notebooklm",
             "status": "invalid_auth",
             "error": "Corrupt auth file"
-        }
+        }, None
     except Exception as e:
         return {
             "service": "notebooklm",
             "status": "error",
             "error": str(e)[:50]
-        }
+        }, None
 
 
-def check_all_services() -> dict[str, Any]:
-    """Check all services and return combined status."""
-    lm_status = check_lm_studio()
-    nb_status = check_notebooklm_auth()
+def check_notebooklm_auth() -> dict[str, Any]:
+    """
+    Check NotebookLM authentication status.
+
+    An "authenticated" result is remembered in AUTH_CACHE_PATH, keyed by the
+    auth file's mtime and size, and reused for up to AUTH_CACHE_TTL seconds
+    (never past the point where it would become "expiring_soon").
+    """
+    try:
+        stat = os.stat(NOTEBOOKLM_AUTH_PATH)
+    except FileNotFoundError:
+        return {
+            "service": "notebooklm",
+            "status": "no_auth",
+            "error": "Auth file not found"
+        }
+    except OSError as e:
+        return {
+            "service": "notebooklm",
+            "status": "error",
+            "error": str(e)[:50]
+        }
+
+    key = f"{stat.st_mtime_ns}:{stat.st_size}"
+    now = time.time()
+    try:
+        with open(AUTH_CACHE_PATH, "rb") as f:
+            cached = loads(f.read())
+        if cached["key"] == key and cached["checked_at"] <= now < cached["valid_until"]:
+            return cached["status"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    status, expiring_at = _check_auth_file()
+    if status["status"] == "authenticated":
+        valid_until = now + AUTH_CACHE_TTL
+        if expiring_at is not None:
+            valid_until = min(valid_until, expiring_at)
+        write_json_atomic(AUTH_CACHE_PATH, {
+            "key": key,
+            "status": status,
+            "checked_at": now,
+            "valid_until": valid_until
+        })
+    return status
+
+
+def check_all_services(lm_http_cache: dict[str, Any] | None = None) -> dict[str, Any]:
+    """
+    Check all services and return combined status.
+
+    Args:
+        lm_http_cache: Conditional-request state for check_lm_studio()
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    # The checks are independent: the LM Studio request runs on one worker
+    # thread while the auth file is checked here, so the total wait is the
+    # slower of the two rather than their sum
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        lm_future = pool.submit(check_lm_studio, lm_http_cache)
+        nb_status = check_notebooklm_auth()
+        lm_status = lm_future.result()
 
     # Determine overall health
     critical_down = lm_status["status"] == "down"
@@ -175,36 +379,76 @@ def check_all_services() -> dict[str, Any]:
     }
 
 
+def cached_check_all_services(ttl_seconds: float) -> dict[str, Any]:
+    """
+    check_all_services(), served from the on-disk cache while it is fresh.
+
+    A stale entry still supplies the LM Studio ETag/Last-Modified, so the
+    re-check can be answered with 304 Not Modified. Entries written for a
+    different LM_STUDIO_URL are ignored entirely. Results carry "cached"
+    and, when served from the cache, "cached_age_s" (seconds since the
+    check ran).
+
+    Args:
+        ttl_seconds: Maximum age of a cached result; 0 always re-checks
+    """
+    cached: dict[str, Any] = {}
+    try:
+        age = time.time() - os.stat(STATUS_CACHE_PATH).st_mtime
+        with open(STATUS_CACHE_PATH, "rb") as f:
+            cached = loads(f.read())
+        if cached["lm_studio_url"] != LM_STUDIO_URL:
+            cached = {}
+        elif ttl_seconds > 0 and age < ttl_seconds:
+            return {**cached["status"], "cached": True, "cached_age_s": round(age, 1)}
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    lm_http_cache = cached.get("lm_studio_http") if isinstance(cached, dict) else None
+    if not isinstance(lm_http_cache, dict):
+        lm_http_cache = {}
+    status = check_all_services(lm_http_cache)
+    status["cached"] = False
+
+    write_json_atomic(STATUS_CACHE_PATH, {
+        "lm_studio_url": LM_STUDIO_URL,
+        "status": status,
+        "lm_studio_http": lm_http_cache
+    })
+
+    return status
+
+
 def format_compact(status: dict[str, Any]) -> str:
     """Format status as compact single line for hook injection."""
-    parts = []
-
     lm = status["services"]["lm_studio"]
     if lm["status"] == "healthy":
-        model_count = lm.get("model_count", 0)
-        parts.append(f"LM:{model_count}m")
+        lm_str = f"LM:{lm.get('model_count', 0)}m"
     elif lm["status"] == "no_models":
-        parts.append("LM:no-models")
+        lm_str = "LM:no-models"
     else:
-        parts.append("LM:DOWN")
+        lm_str = "LM:DOWN"
 
     nb = status["services"]["notebooklm"]
     if nb["status"] == "authenticated":
-        parts.append("NB:OK")
+        nb_str = "NB:OK"
     elif nb["status"] == "expiring_soon":
-        parts.append(f"NB:exp-{nb.get('days_left', '?')}d")
+        nb_str = f"NB:exp-{nb.get('days_left', '?')}d"
     elif nb["status"] == "expired":
-        parts.append("NB:EXPIRED")
+        nb_str = "NB:EXPIRED"
     else:
-        parts.append("NB:NO-AUTH")
+        nb_str = "NB:NO-AUTH"
 
-    return f"[{' | '.join(parts)}]"
+    return f"[{lm_str} | {nb_str}]"
 
 
 def format_human(status: dict[str, Any]) -> str:
     """Format status for human reading."""
+    header = f"ARTHUR_RAG Services - {status['timestamp']}"
+    if status.get("cached"):
+        header += f" (cached, {status['cached_age_s']:.0f}s old)"
     lines = [
-        f"ARTHUR_RAG Services - {status['timestamp']}",
+        header,
         f"Overall: {status['overall'].upper()}",
         ""
     ]
@@ -231,8 +475,10 @@ def format_human(status: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def main() -> int:
-    """CLI entry point."""
+def _parse_args(argv: list[str]) -> Any:
+    """Parse the full command line."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Check ARTHUR_RAG service status"
     )
@@ -246,17 +492,51 @@ def main() -> int:
         action="store_true",
         help="Output full JSON"
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON output (default: compact)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always probe services instead of using a recent cached result"
+    )
+    parser.add_argument(
+        "--ttl",
+        type=float,
+        metavar="N",
+        help=f"Cache freshness in seconds (default: {COMPACT_CACHE_TTL} compact, {DEFAULT_CACHE_TTL} otherwise)"
+    )
+    return parser.parse_args(argv)
 
-    args = parser.parse_args()
 
-    status = check_all_services()
+def main() -> int:
+    """CLI entry point."""
+    argv = sys.argv[1:]
 
-    if args.json:
-        print(json.dumps(status, indent=2))
-    elif args.compact:
-        print(format_compact(status))
+    # Hook invocations use no flags or just --compact; skip argparse for them
+    if argv in ([], ["-c"], ["--compact"]):
+        compact = bool(argv)
+        status = cached_check_all_services(COMPACT_CACHE_TTL if compact else DEFAULT_CACHE_TTL)
+        print(format_compact(status) if compact else format_human(status))
     else:
-        print(format_human(status))
+        args = _parse_args(argv)
+
+        if args.no_cache:
+            ttl = 0.0
+        elif args.ttl is not None:
+            ttl = args.ttl
+        else:
+            ttl = COMPACT_CACHE_TTL if args.compact else DEFAULT_CACHE_TTL
+        status = cached_check_all_services(ttl)
+
+        if args.json:
+            print(dumps(status, pretty=args.pretty).decode("utf-8"))
+        elif args.compact:
+            print(format_compact(status))
+        else:
+            print(format_human(status))
 
     # Exit codes
     if status["overall"] == "critical":
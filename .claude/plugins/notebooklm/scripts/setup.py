@@ -14,19 +14,27 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import importlib.metadata
 import json
 import os
 import shutil
 import subprocess
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable
 
+from _auth_cache import load_auth
+from _json_utils import dumps
 
 # Configuration
 AUTH_FILE = Path.home() / ".notebooklm-mcp" / "auth.json"
 PACKAGE_NAME = "notebooklm-mcp-server"
 
+# Check-mark prefix for status lines
+_ICON = {True: "[OK]", False: "[  ]"}
+
 
 @dataclass
 class SetupStatus:
@@ -48,39 +56,37 @@ class SetupStatus:
             "errors": self.errors
         }
 
+    def refresh(self, *, only: set[str]) -> None:
+        """Re-run the checks behind the named fields, leaving the rest as is."""
+        for name, probe in _PROBES.items():
+            if name in only:
+                setattr(self, name, probe())
+
 
+@lru_cache(maxsize=None)
 def check_command_exists(cmd: str) -> bool:
-    """Check if a command exists in PATH."""
+    """Check if a command exists in PATH (memoized; see install_package)."""
     return shutil.which(cmd) is not None
 
 
 def check_package_installed() -> bool:
-    """Check if notebooklm-mcp-server is installed."""
-    # Check if the command exists
-    if check_command_exists("notebooklm-mcp"):
-        return True
-
-    # Also check via pip
+    """
+    Check if notebooklm-mcp-server is installed, either in this interpreter
+    or as a command on PATH (e.g. via `uv tool install`). No subprocess is run.
+    """
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pip", "show", PACKAGE_NAME],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        return result.returncode == 0
-    except Exception:
-        return False
+        importlib.metadata.distribution(PACKAGE_NAME)
+        return True
+    except importlib.metadata.PackageNotFoundError:
+        return check_command_exists("notebooklm-mcp")
 
 
 def check_auth_status() -> tuple[bool, dict | None]:
     """Check authentication status."""
-    if not AUTH_FILE.exists():
-        return False, None
-
     try:
-        with open(AUTH_FILE) as f:
-            auth_data = json.load(f)
+        auth_data = load_auth(AUTH_FILE)
+        if auth_data is None:
+            return False, None
 
         # Check if we have required fields
         has_cookies = bool(auth_data.get("cookies"))
@@ -91,16 +97,20 @@ def check_auth_status() -> tuple[bool, dict | None]:
         return False, None
 
 
+# Check behind each SetupStatus field
+_PROBES: dict[str, Callable[[], bool]] = {
+    "uv_available": lambda: check_command_exists("uv"),
+    "pip_available": lambda: check_command_exists("pip") or check_command_exists("pip3"),
+    "package_installed": check_package_installed,
+    "auth_file_exists": lambda: AUTH_FILE.exists(),
+    "auth_configured": lambda: check_auth_status()[0],
+}
+
+
 def get_setup_status() -> SetupStatus:
     """Get current setup status."""
     status = SetupStatus()
-
-    status.uv_available = check_command_exists("uv")
-    status.pip_available = check_command_exists("pip") or check_command_exists("pip3")
-    status.package_installed = check_package_installed()
-    status.auth_file_exists = AUTH_FILE.exists()
-    status.auth_configured, _ = check_auth_status()
-
+    status.refresh(only=set(_PROBES))
     return status
 
 
@@ -122,6 +132,8 @@ def install_package(use_uv: bool = True) -> bool:
             text=True,
             timeout=300
         )
+        # The install may have added commands to PATH
+        check_command_exists.cache_clear()
         return result.returncode == 0
     except subprocess.TimeoutExpired:
         print("Installation timed out")
@@ -170,14 +182,11 @@ def print_status(status: SetupStatus) -> None:
     print("NotebookLM MCP Setup Status")
     print("=" * 50)
 
-    def status_icon(ok: bool) -> str:
-        return "[OK]" if ok else "[  ]"
-
-    print(f"\n{status_icon(status.uv_available)} uv available")
-    print(f"{status_icon(status.pip_available)} pip available")
-    print(f"{status_icon(status.package_installed)} Package installed ({PACKAGE_NAME})")
-    print(f"{status_icon(status.auth_file_exists)} Auth file exists ({AUTH_FILE})")
-    print(f"{status_icon(status.auth_configured)} Authentication configured")
+    print(f"\n{_ICON[status.uv_available]} uv available")
+    print(f"{_ICON[status.pip_available]} pip available")
+    print(f"{_ICON[status.package_installed]} Package installed ({PACKAGE_NAME})")
+    print(f"{_ICON[status.auth_file_exists]} Auth file exists ({AUTH_FILE})")
+    print(f"{_ICON[status.auth_configured]} Authentication configured")
 
     if status.package_installed and status.auth_configured:
         print("\n[OK] Setup complete! The MCP server is ready to use.")
@@ -237,6 +246,11 @@ Examples:
         action="store_true",
         help="Output status as JSON"
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON output (default: compact)"
+    )
 
     args = parser.parse_args()
 
@@ -245,7 +259,7 @@ Examples:
 
     # JSON output mode
     if args.json:
-        print(json.dumps(status.to_dict(), indent=2))
+        print(dumps(status.to_dict(), pretty=args.pretty).decode("utf-8"))
         return 0 if status.package_installed and status.auth_configured else 1
 
     # Check only mode
@@ -273,7 +287,8 @@ Examples:
         success = run_authentication(auto_mode=not args.manual_auth)
         if success:
             print("\nAuthentication successful!")
-            status = get_setup_status()
+            # Authentication cannot change the install state
+            status.refresh(only={"auth_configured", "auth_file_exists"})
             print_status(status)
             return 0
         else:
@@ -18,15 +18,26 @@ import json
 import os
 import subprocess
 import sys
+import time
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from _auth_cache import load_auth
+from _json_utils import dumps, loads, write_json_atomic
 
 # Configuration
 AUTH_FILE = Path.home() / ".notebooklm-mcp" / "auth.json"
 AUTH_DIR = Path.home() / ".notebooklm-mcp"
+# Parsed auth file contents, keyed by the file's mtime and size
+VERIFY_CACHE_FILE = AUTH_DIR / ".verify_cache.json"
+# Last successful MCP server probe, reused for MCP_PROBE_TTL seconds
+MCP_PROBE_CACHE_FILE = AUTH_DIR / ".mcp_probe.json"
+MCP_PROBE_TTL = 60
+
+# Check-mark prefix for status lines
+_ICON = {True: "[OK]", False: "[  ]"}
 
 
 @dataclass
@@ -54,46 +65,23 @@ class AuthStatus:
         }
 
 
-def get_auth_status() -> AuthStatus:
-    """Check authentication status."""
-    status = AuthStatus()
-    errors = []
-
-    # Check if auth directory exists
-    if not AUTH_DIR.exists():
-        errors.append(f"Auth directory not found: {AUTH_DIR}")
-        status.errors = errors
-        return status
-
-    # Check if auth file exists
-    if not AUTH_FILE.exists():
-        errors.append(f"Auth file not found: {AUTH_FILE}")
-        status.errors = errors
-        return status
-
-    status.auth_file_exists = True
-
-    # Get file modification time
-    try:
-        mtime = AUTH_FILE.stat().st_mtime
-        mod_time = datetime.fromtimestamp(mtime)
-        status.last_modified = mod_time.isoformat()
-
-        # Estimate expiration (cookies typically last 2-4 weeks)
-        from datetime import timedelta
-        expires = mod_time + timedelta(weeks=2)
-        status.expires_estimate = expires.isoformat()
+def _parse_auth_file() -> tuple[AuthStatus, bool]:
+    """
+    Status fields that depend only on the auth file's contents.
 
-        # Check if likely expired
-        if datetime.now() > expires:
-            errors.append("Authentication may have expired (>2 weeks old)")
-    except Exception as e:
-        errors.append(f"Could not read file stats: {e}")
+    Returns:
+        Tuple of (status, whether the file was read and parsed); only a
+        parsed result describes the file itself and may be cached
+    """
+    status = AuthStatus(auth_file_exists=True)
+    errors = []
+    parsed = False
 
-    # Parse auth file
     try:
-        with open(AUTH_FILE) as f:
-            auth_data = json.load(f)
+        auth_data = load_auth(AUTH_FILE)
+        if auth_data is None:
+            raise FileNotFoundError(f"Auth file not found: {AUTH_FILE}")
+        parsed = True
 
         # Check for cookies
         cookies = auth_data.get("cookies", [])
@@ -119,11 +107,102 @@ def get_auth_status() -> AuthStatus:
     if errors:
         status.errors = errors
 
+    return status, parsed
+
+
+def _cached_parse_auth_file(key: str) -> AuthStatus:
+    """
+    _parse_auth_file(), reusing the stored result while the auth file is
+    unchanged (same mtime and size). Read and decode failures are not
+    cached, since fixing them (e.g. chmod) need not change mtime or size.
+    """
+    try:
+        with open(VERIFY_CACHE_FILE, "rb") as f:
+            cached = loads(f.read())
+        if cached.get("key") == key:
+            return AuthStatus(**cached["status"])
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+
+    status, parsed = _parse_auth_file()
+    if parsed:
+        write_json_atomic(VERIFY_CACHE_FILE, {"key": key, "status": status.to_dict()})
+    return status
+
+
+def get_auth_status() -> AuthStatus:
+    """Check authentication status."""
+    status = AuthStatus()
+    errors = []
+
+    # One stat() answers existence and modification time; the directory is
+    # only looked at to explain a missing file
+    try:
+        stat = AUTH_FILE.stat()
+    except FileNotFoundError:
+        if not AUTH_DIR.exists():
+            errors.append(f"Auth directory not found: {AUTH_DIR}")
+        else:
+            errors.append(f"Auth file not found: {AUTH_FILE}")
+        status.errors = errors
+        return status
+    except OSError as e:
+        stat = None
+        errors.append(f"Could not read file stats: {e}")
+
+    if stat is not None:
+        status = _cached_parse_auth_file(f"{stat.st_mtime_ns}:{stat.st_size}")
+
+        mod_time = datetime.fromtimestamp(stat.st_mtime)
+        status.last_modified = mod_time.isoformat()
+
+        # Estimate expiration (cookies typically last 2-4 weeks)
+        expires = mod_time + timedelta(weeks=2)
+        status.expires_estimate = expires.isoformat()
+
+        # Check if likely expired
+        if datetime.now() > expires:
+            errors.append("Authentication may have expired (>2 weeks old)")
+    else:
+        status, _ = _parse_auth_file()
+
+    errors.extend(status.errors or [])
+    status.errors = errors or None
+
     return status
 
 
-def test_mcp_connection() -> dict[str, Any]:
-    """Test the MCP server connection."""
+def test_mcp_connection(use_cache: bool = True) -> dict[str, Any]:
+    """
+    Test the MCP server connection.
+
+    Starting the server is slow, so a successful result is cached in
+    MCP_PROBE_CACHE_FILE and reused for MCP_PROBE_TTL seconds.
+
+    Args:
+        use_cache: Reuse a recent successful probe instead of starting the server
+    """
+    if use_cache:
+        try:
+            with open(MCP_PROBE_CACHE_FILE, "rb") as f:
+                cached = loads(f.read())
+            if time.time() - cached["ts"] < cached.get("ttl", MCP_PROBE_TTL):
+                return cached["result"]
+        except (OSError, ValueError, TypeError, KeyError):
+            pass
+
+    result = _probe_mcp_server()
+    if result["success"]:
+        write_json_atomic(MCP_PROBE_CACHE_FILE, {
+            "ts": time.time(),
+            "ttl": MCP_PROBE_TTL,
+            "result": result
+        })
+    return result
+
+
+def _probe_mcp_server() -> dict[str, Any]:
+    """Start the MCP server and send it an initialize request."""
     result = {
         "success": False,
         "mcp_command_exists": False,
@@ -149,7 +228,7 @@ def test_mcp_connection() -> dict[str, Any]:
         )
 
         # Send a simple initialize request
-        init_request = json.dumps({
+        init_request = dumps({
             "jsonrpc": "2.0",
             "id": 1,
             "method": "initialize",
@@ -158,7 +237,7 @@ def test_mcp_connection() -> dict[str, Any]:
                 "capabilities": {},
                 "clientInfo": {"name": "test", "version": "1.0"}
             }
-        }) + "\n"
+        }).decode("utf-8") + "\n"
 
         try:
             stdout, stderr = proc.communicate(input=init_request, timeout=10)
@@ -168,7 +247,7 @@ def test_mcp_connection() -> dict[str, Any]:
                 for line in stdout.strip().split('\n'):
                     if line:
                         try:
-                            response = json.loads(line)
+                            response = loads(line)
                             if "result" in response:
                                 result["success"] = True
                                 result["server_info"] = response.get("result", {}).get("serverInfo")
@@ -196,22 +275,19 @@ def print_status(status: AuthStatus) -> None:
     print("NotebookLM MCP Authentication Status")
     print("=" * 50)
 
-    def icon(ok: bool) -> str:
-        return "[OK]" if ok else "[  ]"
-
-    print(f"\n{icon(status.auth_file_exists)} Auth file exists")
+    print(f"\n{_ICON[status.auth_file_exists]} Auth file exists")
     print(f"   Path: {AUTH_FILE}")
 
     if status.auth_file_exists:
-        print(f"\n{icon(status.has_cookies)} Cookies present ({status.cookie_count} cookies)")
-        print(f"{icon(status.has_csrf_token)} CSRF token present")
+        print(f"\n{_ICON[status.has_cookies]} Cookies present ({status.cookie_count} cookies)")
+        print(f"{_ICON[status.has_csrf_token]} CSRF token present")
 
         if status.last_modified:
             print(f"\n   Last modified: {status.last_modified}")
         if status.expires_estimate:
             print(f"   Estimated expiry: {status.expires_estimate}")
 
-    print(f"\n{icon(status.auth_valid)} Authentication valid")
+    print(f"\n{_ICON[status.auth_valid]} Authentication valid")
 
     if status.errors:
         print("\nWarnings/Errors:")
@@ -238,6 +314,7 @@ Examples:
   %(prog)s              # Check auth status
   %(prog)s --json       # Output as JSON
   %(prog)s --test       # Test MCP server connection
+  %(prog)s --test --no-cache  # Always start the server for the test
   %(prog)s --reauth     # Show re-authentication instructions
         """
     )
@@ -247,11 +324,21 @@ Examples:
         action="store_true",
         help="Output status as JSON"
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON output (default: compact)"
+    )
     parser.add_argument(
         "--test",
         action="store_true",
         help="Test MCP server connection"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"With --test, ignore a successful result from the last {MCP_PROBE_TTL}s"
+    )
     parser.add_argument(
         "--reauth",
         action="store_true",
@@ -282,14 +369,14 @@ Examples:
     # Test MCP connection
     if args.test:
         print("Testing MCP server connection...")
-        test_result = test_mcp_connection()
+        test_result = test_mcp_connection(use_cache=not args.no_cache)
 
         if args.json:
             output = {
                 "auth_status": status.to_dict(),
                 "connection_test": test_result
             }
-            print(json.dumps(output, indent=2))
+            print(dumps(output, pretty=args.pretty).decode("utf-8"))
         else:
             print_status(status)
             print("\n" + "-" * 50)
@@ -309,7 +396,7 @@ Examples:
 
     # JSON output
     if args.json:
-        print(json.dumps(status.to_dict(), indent=2))
+        print(dumps(status.to_dict(), pretty=args.pretty).decode("utf-8"))
         return 0 if status.auth_valid else 1
 
     # Default: print status